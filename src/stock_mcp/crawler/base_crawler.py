@@ -1,10 +1,246 @@
+import itertools
+import logging
+import os
 import re
+import socket
+import sqlite3
+import sys
 import time
-import json
 import random
+import threading
 import requests
 from abc import ABC
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, List, Mapping, Union
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+from stock_mcp.data_source_interface import DataSourceError
+from stock_mcp.utils import dns_cache
+from stock_mcp.utils.disk_cache import DiskCache
+from stock_mcp.utils.rate_limiter import TokenBucket
+from stock_mcp.utils.ttl_cache import TTLCache
+
+# 优先使用 orjson 解析（直接接受 bytes，速度快数倍），未安装时回退到标准库
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+logger = logging.getLogger(__name__)
+
+# 爬虫只访问少数几个固定域名，缓存 DNS 解析结果
+# 设置 STOCK_MCP_DNS_TTL 调整缓存秒数，设为 0 关闭；取值无效时使用默认值
+try:
+    DNS_CACHE_TTL = int(os.getenv("STOCK_MCP_DNS_TTL", dns_cache.DEFAULT_TTL))
+except ValueError:
+    logger.warning(
+        f"STOCK_MCP_DNS_TTL={os.getenv('STOCK_MCP_DNS_TTL')!r} 不是整数秒数，使用默认值 {dns_cache.DEFAULT_TTL}"
+    )
+    DNS_CACHE_TTL = dns_cache.DEFAULT_TTL
+if DNS_CACHE_TTL > 0:
+    dns_cache.install(DNS_CACHE_TTL)
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """
+    开启 TCP keep-alive 的 HTTPAdapter
+
+    urllib3 默认已设置 TCP_NODELAY，这里在其基础上追加 SO_KEEPALIVE，
+    使连接池中长时间空闲的连接能被及时探测，而不是在下次请求时才发现已断开。
+    """
+
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", self.SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _build_shared_session() -> requests.Session:
+    """
+    构建进程内共享的 Session
+
+    所有爬虫默认复用同一个连接池，对同一主机的请求走 keep-alive 连接，
+    避免每次调用都重新进行 TCP + TLS 握手。
+    """
+    session = requests.Session()
+    adapter = _KeepAliveAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        # 限流（429）和网关类错误通常是瞬时的，退避后重试
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SHARED_SESSION = _build_shared_session()
+
+
+def get_shared_session() -> requests.Session:
+    """
+    获取进程内共享的 Session
+
+    注意：该 Session 被所有爬虫共用，不要修改 session.headers / session.cookies，
+    站点相关的请求头应放在爬虫的 DEFAULT_HEADERS 或通过 _get(headers=...) 按请求传入。
+    """
+    return _SHARED_SESSION
+
+
+def close_shared_session() -> None:
+    """
+    关闭共享 Session 中的空闲连接
+
+    连接池关闭后仍可继续使用，后续请求会按需重新建立连接。
+    """
+    _SHARED_SESSION.close()
+
+
+# 响应缓存：设置 STOCK_MCP_HTTP_CACHE=0 可关闭（排查网络问题时使用）
+HTTP_CACHE_ENABLED = os.getenv("STOCK_MCP_HTTP_CACHE", "1") != "0"
+_RESPONSE_CACHE = TTLCache(maxsize=1024)
+
+# 磁盘缓存：设置 STOCK_MCP_DISK_CACHE=<sqlite 文件路径> 启用，
+# 有效期不短于 DISK_CACHE_MIN_TTL 的响应会持久化，进程重启后仍可命中
+DISK_CACHE_PATH = os.getenv("STOCK_MCP_DISK_CACHE")
+DISK_CACHE_MIN_TTL = 600
+
+
+def _open_disk_cache(path: Optional[str]) -> Optional[DiskCache]:
+    """打开磁盘缓存，路径无效或文件无法打开时记录警告并禁用，不影响服务启动"""
+    if not path or not HTTP_CACHE_ENABLED:
+        return None
+    try:
+        return DiskCache(path)
+    except sqlite3.Error as e:
+        logger.warning(f"打开磁盘缓存 {path} 失败，已禁用磁盘缓存: {e}")
+        return None
+
+
+_DISK_CACHE = _open_disk_cache(DISK_CACHE_PATH)
+
+# 日频数据（估值分位、智能评分等）在收盘后更新，缓存到下一个北京时间 16:00
+_BEIJING_TZ = timezone(timedelta(hours=8))
+DAILY_REFRESH_HOUR = 16
+
+# 请求参数 "_" 的防缓存计数器，以毫秒时间戳为起点
+_CACHE_BUSTER = itertools.count(time.time_ns() // 1_000_000)
+
+# 每次请求都会变化、不影响响应内容的参数，不参与缓存键计算
+_VOLATILE_PARAMS = frozenset({"_", "cb", "callback"})
+
+
+def clear_response_cache() -> None:
+    """清空响应缓存（内存及已启用的磁盘缓存），用于需要强制拉取最新数据时"""
+    _RESPONSE_CACHE.clear()
+    if _DISK_CACHE is not None:
+        _DISK_CACHE.clear()
+
+
+# 按主机限流：东方财富对 push2、datacenter-web 等限流严格，平滑出站请求速率
+HOST_RATE_LIMIT = 10
+HOST_RATE_BURST = 20
+_HOST_BUCKETS: Dict[str, TokenBucket] = {}
+_HOST_BUCKETS_LOCK = threading.Lock()
+
+
+def _host_bucket(url: str) -> TokenBucket:
+    """获取 url 所属主机的令牌桶（不存在则创建）"""
+    host = urlsplit(url).hostname or ""
+    bucket = _HOST_BUCKETS.get(host)
+    if bucket is None:
+        with _HOST_BUCKETS_LOCK:
+            bucket = _HOST_BUCKETS.setdefault(host, TokenBucket(HOST_RATE_LIMIT, HOST_RATE_BURST))
+    return bucket
+
+
+# 并发扇出请求使用的线程池，大小与连接池 pool_maxsize 对齐
+_FANOUT_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="crawler")
+
+
+# 股票代码解析：已是 secid（0./1./116.）| 带交易所后缀 | 纯数字
+_SECID_RE = re.compile(r"(?:(0|1|116)\.(\d+)|([^.]*)\.(SZ|SH|HK)|(\d+))")
+_SUFFIX_MARKETS = {"SZ": "0", "SH": "1"}
+
+
+@lru_cache(maxsize=8192)
+def _format_secid(stock_code: str) -> str:
+    """
+    format_secid 的实现，按输入缓存结果（常用股票代码反复出现）
+
+    不同写法的同一代码（如 600000 与 600000.SH）得到同一个驻留字符串，
+    作为下游缓存键时可直接按对象比较。
+    """
+    return sys.intern(_parse_secid(stock_code))
+
+
+def _parse_secid(stock_code: str) -> str:
+    match = _SECID_RE.fullmatch(stock_code.strip().upper())
+    if match is None:
+        raise ValueError(f"无法解析股票代码: {stock_code}")
+
+    market, number, left, suffix, digits = match.groups()
+
+    # 已经是 secid 格式
+    if market is not None:
+        return f"{market}.{number}"
+
+    # 带后缀格式：000977.SZ；H股格式：00977.HK，港股代码补齐为5位
+    if suffix is not None:
+        if suffix == "HK":
+            return f"116.{left.zfill(5)}"
+        return f"{_SUFFIX_MARKETS[suffix]}.{left}"
+
+    # 纯数字代码：6 开头沪市，5位数港股代码（通常以0开头），其他深市
+    if digits[0] == "6":
+        return f"1.{digits}"
+    if len(digits) == 5:
+        return f"116.{digits}"
+    return f"0.{digits}"
+
+
+class CrawlerError(DataSourceError):
+    """爬虫请求失败或接口返回错误"""
+    pass
+
+
+# 启动时预热连接的主机
+PRECONNECT_HOSTS = (
+    "datacenter.eastmoney.com",
+    "datacenter-web.eastmoney.com",
+    "push2.eastmoney.com",
+    "push2his.eastmoney.com",
+    "search-codetable.eastmoney.com",
+)
+
+
+def preconnect(hosts=PRECONNECT_HOSTS, timeout: float = 3) -> None:
+    """
+    在后台向常用主机各发一个 HEAD 请求，提前完成 DNS/TCP/TLS 握手，
+    使连接进入共享连接池，首次工具调用无需再等待握手。
+    不阻塞调用方，失败时忽略。
+    """
+    def warm(host):
+        try:
+            _SHARED_SESSION.head(f"https://{host}/", timeout=timeout)
+        except requests.RequestException as e:
+            logger.debug(f"预连接 {host} 失败: {e}")
+
+    for host in hosts:
+        _FANOUT_EXECUTOR.submit(warm, host)
 
 
 class EastMoneyBaseSpider(ABC):
@@ -12,15 +248,15 @@ class EastMoneyBaseSpider(ABC):
     东方财富爬虫基类
 
     提供通用功能：
-    - Session 管理
+    - Session 管理（默认复用进程内共享的连接池）
     - 请求头/Cookies 配置
     - JSONP 解析
     - 股票代码格式转换
     """
 
-    # 子类可覆盖的默认配置
+    # 子类可覆盖的默认配置（请求头为只读映射，由所有实例共享）
     DEFAULT_TIMEOUT = 10
-    DEFAULT_HEADERS = {
+    DEFAULT_HEADERS = MappingProxyType({
         "Accept": "application/json, text/plain, */*",
         "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
         "Connection": "keep-alive",
@@ -29,16 +265,20 @@ class EastMoneyBaseSpider(ABC):
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/129.0.0.0 Safari/537.36"
         ),
-    }
+    })
+
+    # 实例属性固定，使用 __slots__ 省去每个实例的 __dict__；子类需声明自己新增的属性
+    __slots__ = ("session", "timeout", "headers", "cookies")
 
     def __init__(
             self,
             session: Optional[requests.Session] = None,
             timeout: int = None,
     ):
-        self.session = session or requests.Session()
+        self.session = session or get_shared_session()
         self.timeout = timeout or self.DEFAULT_TIMEOUT
-        self.headers = self.DEFAULT_HEADERS.copy()
+        self.headers: Mapping[str, str] = self.DEFAULT_HEADERS
+        # 东方财富接口无需 Cookie，默认为空；遇到 403 时可按实例设置
         self.cookies: Dict[str, str] = {}
 
     # ==================== 通用工具方法 ====================
@@ -47,52 +287,195 @@ class EastMoneyBaseSpider(ABC):
             self,
             url: str,
             params: Dict[str, Any] = None,
+            headers: Dict[str, str] = None,
             **kwargs
     ) -> requests.Response:
-        """封装 GET 请求"""
+        """
+        封装 GET 请求（按主机限流）
+
+        :param headers: 仅对本次请求生效的额外请求头，会覆盖同名默认值
+        """
+        _host_bucket(url).acquire()
         return self.session.get(
             url,
             params=params,
-            headers=self.headers,
-            cookies=self.cookies,
+            headers={**self.headers, **headers} if headers else self.headers,
+            # 为空时传 None，省去 requests 为每次请求构建并合并 CookieJar
+            cookies=self.cookies or None,
             timeout=self.timeout,
             **kwargs
         )
 
-    def _get_json(self, url: str, params: Dict[str, Any] = None) -> Dict:
-        """GET 请求并解析 JSON"""
-        resp = self._get(url, params)
-        resp.raise_for_status()
-        return resp.json()
+    def _get_json(self, url: str, params: Dict[str, Any] = None, cache_ttl: float = 0) -> Dict:
+        """
+        GET 请求并解析 JSON
+
+        :param cache_ttl: 响应缓存有效期（秒），0 表示不缓存
+        :raises CrawlerError: 网络请求失败或响应不是合法 JSON
+        """
+        def fetch():
+            try:
+                resp = self._get(url, params)
+                if resp.status_code >= 400:
+                    resp.raise_for_status()
+                return _loads(resp.content)
+            except (requests.RequestException, ValueError) as e:
+                raise CrawlerError(str(e)) from e
+
+        return self._cached(url, params, cache_ttl, fetch)
 
-    def _get_jsonp(self, url: str, params: Dict[str, Any] = None) -> Optional[Dict]:
-        """GET 请求并解析 JSONP"""
-        resp = self._get(url, params)
-        resp.raise_for_status()
-        return self._parse_jsonp(resp.text)
+    def _get_jsonp(self, url: str, params: Dict[str, Any] = None, cache_ttl: float = 0) -> Optional[Dict]:
+        """
+        GET 请求并解析 JSONP
+
+        :param cache_ttl: 响应缓存有效期（秒），0 表示不缓存
+        :return: 解析结果，响应不是合法 JSONP 时返回 None
+        :raises CrawlerError: 网络请求失败
+        """
+        def fetch():
+            try:
+                resp = self._get(url, params)
+                if resp.status_code >= 400:
+                    resp.raise_for_status()
+            except requests.RequestException as e:
+                raise CrawlerError(str(e)) from e
+            return self._parse_jsonp(resp.content)
+
+        return self._cached(url, params, cache_ttl, fetch)
+
+    @staticmethod
+    def _cached(url: str, params: Optional[Dict[str, Any]], ttl: float, fetch: Callable[[], Any]) -> Any:
+        """
+        带 TTL 的响应缓存
+
+        同一 url + 参数（忽略 callback、时间戳等易变参数）在有效期内只请求一次。
+        只缓存接口明确返回成功的数据，错误响应不会被缓存。
+        启用磁盘缓存时，内存未命中会再查一次磁盘。
+        返回的是缓存中的同一个对象，调用方不应原地修改。
+        """
+        if not ttl or not HTTP_CACHE_ENABLED:
+            return fetch()
+
+        key = (url, tuple(sorted(
+            (k, str(v)) for k, v in (params or {}).items() if k not in _VOLATILE_PARAMS
+        )))
+        data = _RESPONSE_CACHE.get(key)
+        if data is not None:
+            return data
+
+        use_disk = _DISK_CACHE is not None and ttl >= DISK_CACHE_MIN_TTL
+        if use_disk:
+            item = _DISK_CACHE.get_item(key)
+            if item is not None:
+                # 回填内存缓存，有效期内的后续请求不再查询磁盘
+                remaining, data = item
+                _RESPONSE_CACHE.set(key, data, min(ttl, remaining))
+                return data
+
+        data = fetch()
+        if isinstance(data, dict) and data.get("success", True) is not False \
+                and data.get("code", 0) in (0, "0") and data.get("rc", 0) == 0:
+            _RESPONSE_CACHE.set(key, data, ttl)
+            if use_disk:
+                _DISK_CACHE.set(key, data, ttl)
+        return data
 
     @staticmethod
-    def _parse_jsonp(text: str) -> Optional[Dict]:
+    def _result_data(response: Optional[Dict]) -> Any:
+        """
+        取出数据中心接口（datacenter）响应中的 result.data
+
+        :param response: 接口响应
+        :return: result.data
+        :raises CrawlerError: 响应为空或接口返回失败（如"返回数据为空"）
+        """
+        if response and response.get("code") == 0 and response.get("success") is True and response.get("result"):
+            return response["result"]["data"]
+        message = response.get("message", "未知错误") if response else "未知错误"
+        raise CrawlerError(message)
+
+    @staticmethod
+    def _gather(*calls: Callable[[], Any], return_exceptions: bool = False) -> List[Any]:
+        """
+        并发执行多个互相独立的请求
+
+        各请求在共享线程池中并行发出，复用同一连接池，
+        总耗时约为最慢的一次请求而非各请求耗时之和。
+
+        :param calls: 无参可调用对象，如 lambda: self._get_jsonp(url, params)
+        :param return_exceptions: 为 True 时把异常作为对应位置的结果返回，
+                                  否则任意一个请求抛出的异常会原样抛给调用方
+        :return: 按传入顺序排列的结果列表
+        """
+        def run(call):
+            try:
+                return call()
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        if len(calls) <= 1:
+            return [run(call) for call in calls]
+        futures = [_FANOUT_EXECUTOR.submit(run, call) for call in calls]
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def _parse_json(content: Union[str, bytes]) -> Any:
+        """
+        解析 JSON 响应（安装了 orjson 时使用 orjson），可直接传入 resp.content
+
+        :raises ValueError: 内容不是合法 JSON
+        """
+        return _loads(content)
+
+    @staticmethod
+    def _parse_jsonp(text: Union[str, bytes]) -> Optional[Dict]:
+        """
+        解析 JSONP 响应：callback(...) 或 callback(...);
+
+        按首个 "(" 与最后一个 ")" 直接切片取出 JSON 部分，
+        省去正则匹配和整段 strip 拷贝，可直接传入 resp.content（bytes）。
+        """
+        if isinstance(text, str):
+            open_paren, close_paren, tail_chars = "(", ")", " \t\r\n;"
+        else:
+            open_paren, close_paren, tail_chars = b"(", b")", b" \t\r\n;"
+
+        start = text.find(open_paren)
+        end = text.rfind(close_paren)
         # 允许末尾有分号
-        match = re.search(r'^\w+\((.*)\);?$', text.strip(), re.DOTALL)
-        if not match:
+        if start <= 0 or end <= start or text[end + 1:].strip(tail_chars):
             return None
         try:
-            return json.loads(match.group(1))
-        except json.JSONDecodeError:
+            return _loads(text[start + 1:end])
+        except ValueError:
             return None
 
+    @staticmethod
+    def _daily_cache_ttl() -> float:
+        """距下一个北京时间 16:00（日频数据刷新时间）的秒数，用作日频数据的缓存有效期"""
+        now = datetime.now(_BEIJING_TZ)
+        refresh_at = now.replace(hour=DAILY_REFRESH_HOUR, minute=0, second=0, microsecond=0)
+        if refresh_at <= now:
+            refresh_at += timedelta(days=1)
+        return (refresh_at - now).total_seconds()
+
     @staticmethod
     def _generate_callback() -> str:
         """生成 jQuery 风格的 JSONP callback 名称"""
-        rand_part = random.randint(10 ** 19, 10 ** 20 - 1)
-        ts = int(time.time() * 1000)
-        return f"jQuery{rand_part}_{ts}"
+        # 66 位随机数不超过 20 位十进制，补零后与 jQuery 的 20 位随机串等长
+        return f"jQuery{random.getrandbits(66):020d}_{time.time_ns() // 1_000_000}"
 
     @staticmethod
-    def _timestamp_ms() -> int:
-        """当前时间戳（毫秒）"""
-        return int(time.time() * 1000)
+    def _cache_buster() -> int:
+        """
+        生成请求参数 "_" 的防缓存值
+
+        与 jQuery 的做法一致：以启动时的毫秒时间戳为起点逐次递增，
+        保证唯一且无需每次读取系统时间。
+        """
+        return next(_CACHE_BUSTER)
 
     @staticmethod
     def format_secid(stock_code: str) -> str:
@@ -113,41 +496,4 @@ class EastMoneyBaseSpider(ABC):
         :param stock_code: 股票代码
         :return: secid 格式字符串
         """
-        code = stock_code.strip().upper()
-
-        if "." in code:
-            left, right = code.split(".", maxsplit=1)
-
-            # 已经是 secid 格式
-            if left in {"0", "1", "116"} and right.isdigit():
-                return f"{left}.{right}"
-
-            # 带后缀格式：000977.SZ
-            if right in {"SZ", "SH"}:
-                market = "0" if right == "SZ" else "1"
-                return f"{market}.{left}"
-            
-            # H股格式：00977.HK 或 01810.HK
-            if right == "HK":
-                return f"116.{left.zfill(5)}"  # 港股代码补齐为5位
-
-        # 纯数字代码
-        if code.isdigit():
-            # 6 开头沪市，其他深市
-            if code.startswith("6"):
-                return f"1.{code}"
-            # 5位数港股代码（通常以0开头）
-            elif len(code) == 5:
-                return f"116.{code}"
-            # 其他情况为深市
-            else:
-                return f"0.{code}"
-
-        raise ValueError(f"无法解析股票代码: {stock_code}")
-
-
-
-
-
-
-
+        return _format_secid(stock_code)
@@ -1,8 +1,14 @@
-from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider
+import logging
+import time
+
+from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider, CrawlerError, HTTP_CACHE_ENABLED
 
 import requests
+from types import MappingProxyType
 from typing import List, Optional, Dict
 
+logger = logging.getLogger(__name__)
+
 class StockSearcher(EastMoneyBaseSpider):
     """
     股票搜索（支持代码、名称、拼音模糊搜索）
@@ -15,6 +21,17 @@ class StockSearcher(EastMoneyBaseSpider):
     SEARCH_URL = "https://search-codetable.eastmoney.com/codetable/search/web"
     LAST_TRADING_DAY_URL = "https://www.szse.cn/api/report/exchange/onepersistenthour/monthList?"
 
+    # 股票代码与名称对应关系极少变化，相同关键字的搜索结果缓存复用
+    SEARCH_CACHE_TTL = 3600
+
+    DEFAULT_HEADERS = MappingProxyType({**EastMoneyBaseSpider.DEFAULT_HEADERS, "Referer": "https://www.eastmoney.com/"})
+    # 深交所接口的请求头，按请求传入，不修改实例的 headers
+    LAST_TRADING_DAY_HEADERS = {"Referer": "https://www.szse.cn/"}
+    # 交易日历一天内基本不变：短时间内直接复用，过期后带 ETag/Last-Modified 做条件请求
+    LAST_TRADING_DAY_FRESH_TTL = 60
+
+    __slots__ = ("page_size", "_last_trading_day_cache")
+
     def __init__(
             self,
             session: Optional[requests.Session] = None,
@@ -23,7 +40,8 @@ class StockSearcher(EastMoneyBaseSpider):
     ):
         super().__init__(session, timeout)
         self.page_size = page_size
-        self.headers["Referer"] = "https://www.eastmoney.com/"
+        # (获取时间, ETag, Last-Modified, 响应数据)
+        self._last_trading_day_cache = None
 
     def search(self, keyword: str, page_index: int = 1) -> Optional[List[Dict]]:
         """
@@ -31,7 +49,8 @@ class StockSearcher(EastMoneyBaseSpider):
 
         :param keyword: 搜索关键字（代码/名称/拼音）
         :param page_index: 页码
-        :return: 搜索结果列表，失败返回 None
+        :return: 搜索结果列表，未找到返回 None
+        :raises CrawlerError: 请求失败或接口返回错误
         """
         params = {
             "client": "web",
@@ -42,53 +61,61 @@ class StockSearcher(EastMoneyBaseSpider):
             "pageIndex": page_index,
             "pageSize": self.page_size,
             "securityFilter": "",
-            "_": self._timestamp_ms(),
+            "_": self._cache_buster(),
         }
 
-        try:
-            data = self._get_jsonp(self.SEARCH_URL, params)
-            if data is None:
-                print(f"[StockSearcher] 解析 JSONP 响应失败")
-                return None
-
-            if data.get("code") != "0":
-                print(f"[StockSearcher] 接口错误: {data.get('msg')}")
-                return None
+        data = self._get_jsonp(self.SEARCH_URL, params, cache_ttl=self.SEARCH_CACHE_TTL)
+        if data is None:
+            raise CrawlerError("解析搜索接口 JSONP 响应失败")
 
-            items = data.get("result")
-            if not items:
-                print(f"[StockSearcher] 未找到: '{keyword}'")
-                return None
+        if data.get("code") != "0":
+            raise CrawlerError(f"搜索接口错误: {data.get('msg')}")
 
-            return items
-
-        except requests.RequestException as e:
-            print(f"[StockSearcher] 请求出错: {e}")
+        items = data.get("result")
+        if not items:
+            logger.info(f"未找到股票: '{keyword}'")
             return None
 
-    def last_trading_day(self) -> Optional[Dict]:
+        return items
+
+    def last_trading_day(self) -> Dict:
         """
         获取最近交易日信息
 
-        :return: 包含交易日信息的字典，失败返回 None
+        结果在 LAST_TRADING_DAY_FRESH_TTL 秒内直接复用，之后以条件请求校验，
+        服务端返回 304 时沿用上次的数据。返回的字典被缓存共享，调用方不应原地修改。
+
+        :return: 包含交易日信息的字典
+        :raises CrawlerError: 请求失败或响应不是合法 JSON
         """
-        # 保存原始headers
-        original_headers = self.headers.copy()
-        
-        # 设置适合深交所API的请求头
-        self.headers["Referer"] = "https://www.szse.cn/"
-        self.headers["Host"] = "www.szse.cn"
-        
+        cached = self._last_trading_day_cache if HTTP_CACHE_ENABLED else None
+        if cached and time.monotonic() - cached[0] < self.LAST_TRADING_DAY_FRESH_TTL:
+            return cached[3]
+
+        headers = self.LAST_TRADING_DAY_HEADERS
+        if cached:
+            _, etag, last_modified, _ = cached
+            conditional = {"If-None-Match": etag, "If-Modified-Since": last_modified}
+            headers = {**headers, **{k: v for k, v in conditional.items() if v}}
+
         try:
-            response = self._get(self.LAST_TRADING_DAY_URL)
+            response = self._get(self.LAST_TRADING_DAY_URL, headers=headers)
+            if response.status_code == 304 and cached:
+                # 未变化：只刷新获取时间，复用上次的数据
+                self._last_trading_day_cache = (time.monotonic(), *cached[1:])
+                return cached[3]
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            print(f"[StockSearcher] 获取最近交易日信息出错: {e}")
-            return None
-        finally:
-            # 恢复原始headers
-            self.headers = original_headers
+            data = self._parse_json(response.content)
+        except (requests.RequestException, ValueError) as e:
+            raise CrawlerError(f"获取最近交易日信息失败: {e}") from e
+
+        self._last_trading_day_cache = (
+            time.monotonic(),
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            data,
+        )
+        return data
 
 if __name__ == '__main__':
     searcher = StockSearcher()
@@ -1,8 +1,13 @@
-from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider
+import logging
+from datetime import datetime
+
+from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider, CrawlerError
 
 import requests
 from typing import Optional, Dict, Any, List
 
+logger = logging.getLogger(__name__)
+
 
 class FinancialAnalysisCrawler(EastMoneyBaseSpider):
     """
@@ -13,6 +18,23 @@ class FinancialAnalysisCrawler(EastMoneyBaseSpider):
     
     BASE_URL = "https://datacenter.eastmoney.com/securities/api/data/v1/get"
 
+    # 业绩概况的固定请求参数，调用时只补充 filter
+    FINANCIAL_SUMMARY_PARAMS = {
+        "reportName": "RPT_F10_FN_PERFORM",
+        "columns": "SECUCODE,SECURITY_CODE,SECURITY_NAME_ABBR,ORG_CODE,REPORT_DATE,DATE_TYPE_CODE,DATE_TYPE,PARENTNETPROFIT,TOTALOPERATEREVE,KCFJCXSYJLR,PARENTNETPROFIT_RATIO,TOTALOPERATEREVE_RATIO,KCFJCXSYJLR_RATIO,YEAR,TYPE,IS_PUBLISH",
+        "sortTypes": "-1",
+        "sortColumns": "REPORT_DATE",
+        "pageNumber": 1,
+        "pageSize": 200,
+        "source": "F10",
+        "client": "PC",
+        "v": "0748758885949164"
+    }
+    # 业绩概况只在定期报告披露时变化
+    FINANCIAL_SUMMARY_CACHE_TTL = 3600
+
+    __slots__ = ()
+
     def __init__(
             self,
             session: Optional[requests.Session] = None,
@@ -39,29 +61,12 @@ class FinancialAnalysisCrawler(EastMoneyBaseSpider):
         :return: 业绩概况数据列表
         """
         params = {
-            "reportName": "RPT_F10_FN_PERFORM",
-            "columns": "SECUCODE,SECURITY_CODE,SECURITY_NAME_ABBR,ORG_CODE,REPORT_DATE,DATE_TYPE_CODE,DATE_TYPE,PARENTNETPROFIT,TOTALOPERATEREVE,KCFJCXSYJLR,PARENTNETPROFIT_RATIO,TOTALOPERATEREVE_RATIO,KCFJCXSYJLR_RATIO,YEAR,TYPE,IS_PUBLISH",
+            **self.FINANCIAL_SUMMARY_PARAMS,
             "filter": f'(SECUCODE="{stock_code}")(DATE_TYPE_CODE in ("{date_type_code}"))',
-            "sortTypes": "-1",
-            "sortColumns": "REPORT_DATE",
-            "pageNumber": 1,
-            "pageSize": 200,
-            "source": "F10",
-            "client": "PC",
-            "v": "0748758885949164"
         }
         
-        try:
-            response = self._get_json(self.BASE_URL, params)
-            # 检查响应是否成功
-            if response.get("code") == 0 and response.get("success") is True and response.get("result"):
-                return response["result"]["data"]
-            else:
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误")
-                return [{"error": message}]
-        except Exception as e:
-            return [{"error": str(e)}]
+        response = self._get_json(self.BASE_URL, params, cache_ttl=self.FINANCIAL_SUMMARY_CACHE_TTL)
+        return self._result_data(response)
 
     def get_holder_number(self, stock_code: str) -> Optional[List[Dict[Any, Any]]]:
         """
@@ -83,17 +88,8 @@ class FinancialAnalysisCrawler(EastMoneyBaseSpider):
             "v": "07356204940503169"
         }
         
-        try:
-            response = self._get_json(self.BASE_URL, params)
-            # 检查响应是否成功
-            if response.get("code") == 0 and response.get("success") is True and response.get("result"):
-                return response["result"]["data"]
-            else:
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误")
-                return [{"error": message}]
-        except Exception as e:
-            return [{"error": str(e)}]
+        response = self._get_json(self.BASE_URL, params)
+        return self._result_data(response)
 
     def get_latest_report_dates(self, stock_code: str) -> Optional[List[str]]:
         """
@@ -101,6 +97,7 @@ class FinancialAnalysisCrawler(EastMoneyBaseSpider):
 
         :param stock_code: 股票代码，要在数字后加上交易所代码，格式如688041.SH
         :return: 最新三个报告日期列表，格式为 YYYY-MM-DD
+        :raises CrawlerError: 请求失败或接口返回错误
         """
         params = {
             "reportName": "RPT_F10_INDUSTRY_COMPARED",
@@ -116,31 +113,20 @@ class FinancialAnalysisCrawler(EastMoneyBaseSpider):
             "v": "005130138354940328"
         }
         
-        try:
-            response = self._get_json(self.BASE_URL, params)
-            # 检查响应是否成功
-            if response.get("code") == 0 and response.get("success") is True and response.get("result"):
-                data = response["result"]["data"]
-                if data:
-                    dates = []
-                    seen_dates = set()
-                    for item in data:
-                        report_date = item.get("REPORT_DATE")
-                        if report_date:
-                            # 格式化为 YYYY-MM-DD
-                            formatted_date = report_date.split()[0]
-                            if formatted_date not in seen_dates:
-                                dates.append(formatted_date)
-                                seen_dates.add(formatted_date)
-                    return dates
-                else:
-                    return []
-            else:
-                # 如果不成功，记录错误信息
-                message = response.get("message", "未知错误")
-                return [message]
-        except Exception as e:
-            return [f"获取最新报告日期时发生异常: {str(e)}"]
+        response = self._get_json(self.BASE_URL, params)
+        data = self._result_data(response)
+
+        dates = []
+        seen_dates = set()
+        for item in data or []:
+            report_date = item.get("REPORT_DATE")
+            if report_date:
+                # 格式化为 YYYY-MM-DD
+                formatted_date = report_date.split()[0]
+                if formatted_date not in seen_dates:
+                    dates.append(formatted_date)
+                    seen_dates.add(formatted_date)
+        return dates
 
     def get_financial_ratios(self, stock_code: str, report_dates: List[str] = None) -> Optional[List[Dict[Any, Any]]]:
         """
@@ -152,15 +138,17 @@ class FinancialAnalysisCrawler(EastMoneyBaseSpider):
         """
         # 如果没有提供报告日期，则获取最新的两个报告日期
         if not report_dates:
-            latest_dates = self.get_latest_report_dates(stock_code)
+            try:
+                latest_dates = self.get_latest_report_dates(stock_code)
+            except CrawlerError as e:
+                raise CrawlerError(f"无法获取有效的报告日期: {e}") from e
             # 只取前两个日期
-            report_dates = latest_dates[:4] if latest_dates else []
-            
-            # 处理可能的错误情况
-            if not report_dates or isinstance(report_dates[0], str) and "异常" in report_dates[0]:
-                return [{"error": "无法获取有效的报告日期"}]
+            report_dates = latest_dates[:4]
+            if not report_dates:
+                raise CrawlerError("无法获取有效的报告日期")
 
         all_data = []
+        last_error = None
         for report_date in report_dates:
             params = {
                 "reportName": "RPT_F10_FINANALYSIS",
@@ -184,16 +172,15 @@ class FinancialAnalysisCrawler(EastMoneyBaseSpider):
             
             try:
                 response = self._get_json(self.BASE_URL, params)
-                # 检查响应是否成功
-                if response.get("code") == 0 and response.get("success") is True and response.get("result"):
-                    all_data.extend(response["result"]["data"])
-                else:
-                    # 如果不成功，添加错误信息
-                    message = response.get("message", "未知错误")
-                    all_data.extend([{"error": message}])
-            except Exception as e:
-                all_data.extend([{"error": str(e)}])
-                
+                all_data.extend(self._result_data(response))
+            except CrawlerError as e:
+                # 单个报告期失败时跳过，其余报告期照常返回
+                logger.warning(f"获取 {stock_code} 报告期 {report_date} 数据失败: {e}")
+                last_error = e
+
+        # 所有报告期都失败时抛出最后一个错误
+        if not all_data and last_error is not None:
+            raise last_error
         return all_data
 
     def get_industry_profit_comparison(self, stock_code: str, report_dates: List[str] = None) -> Optional[List[Dict[Any, Any]]]:
@@ -206,16 +193,20 @@ class FinancialAnalysisCrawler(EastMoneyBaseSpider):
         """
         # 如果没有提供报告日期，则获取最新的三个报告日期
         if not report_dates:
-            report_dates = self.get_latest_report_dates(stock_code)
-            if not report_dates or isinstance(report_dates[0], str) and "异常" in report_dates[0]:
+            try:
+                report_dates = self.get_latest_report_dates(stock_code)
+            except CrawlerError as e:
+                logger.warning(f"获取最新报告日期失败，使用默认报告日期: {e}")
+                report_dates = []
+            if not report_dates:
                 # 尝试使用一个默认的近期报告日期
-                import datetime
                 # 使用今年的年报日期作为备选方案
-                curr_year = datetime.datetime.now().year
+                curr_year = datetime.now().year
                 default_date = f"{curr_year}-9-30"
                 report_dates = [default_date]
 
         all_data = []
+        last_error = None
         for report_date in report_dates:
             params = {
                 "reportName": "RPT_F10_INDUSTRY_COMPARED",
@@ -233,14 +224,13 @@ class FinancialAnalysisCrawler(EastMoneyBaseSpider):
             
             try:
                 response = self._get_json(self.BASE_URL, params)
-                # 检查响应是否成功
-                if response.get("code") == 0 and response.get("success") is True and response.get("result"):
-                    all_data.extend(response["result"]["data"])
-                else:
-                    # 如果不成功，添加错误信息
-                    message = response.get("message", "未知错误")
-                    all_data.extend([{"error": message}])
-            except Exception as e:
-                all_data.extend([{"error": str(e)}])
-        
+                all_data.extend(self._result_data(response))
+            except CrawlerError as e:
+                # 单个报告期失败时跳过，其余报告期照常返回
+                logger.warning(f"获取 {stock_code} 报告期 {report_date} 数据失败: {e}")
+                last_error = e
+
+        # 所有报告期都失败时抛出最后一个错误
+        if not all_data and last_error is not None:
+            raise last_error
         return all_data
@@ -1,11 +1,12 @@
-import json
-import re
+import logging
 
-from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider
+from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider, CrawlerError
 
 import requests
 from typing import Optional, Dict, Any, List
 
+logger = logging.getLogger(__name__)
+
 
 class FundamentalDataCrawler(EastMoneyBaseSpider):
     """
@@ -19,6 +20,52 @@ class FundamentalDataCrawler(EastMoneyBaseSpider):
     BUSINESS_SCOPE_URL = "https://datacenter.eastmoney.com/securities/api/data/v1/get"
     BUSINESS_REVIEW_URL = "https://datacenter.eastmoney.com/securities/api/data/v1/get"
     MAIN_DATA_URL = "https://push2.eastmoney.com/api/qt/stock/get"
+    # push2 行情接口需要带 Referer，按请求传入，不修改实例的 headers
+    MAIN_DATA_HEADERS = {"Referer": "https://www.eastmoney.com/"}
+
+    # 各报表的固定请求参数，调用时只补充 filter 等动态字段
+    REPORT_DATE_PARAMS = {
+        "reportName": "RPT_F10_FN_MAINOP",
+        "columns": "SECUCODE,REPORT_DATE",
+        "distinct": "REPORT_DATE",
+        "pageNumber": 1,
+        "pageSize": "",
+        "sortTypes": "-1",
+        "sortColumns": "REPORT_DATE",
+        "source": "HSF10",
+        "client": "PC"
+    }
+    BUSINESS_SCOPE_PARAMS = {
+        "reportName": "RPT_HSF9_BASIC_ORGINFO",
+        "columns": "SECUCODE,SECURITY_CODE,BUSINESS_SCOPE",
+        "pageNumber": 1,
+        "pageSize": 1,
+        "source": "HSF10",
+        "client": "PC"
+    }
+    BUSINESS_REVIEW_PARAMS = {
+        "reportName": "RPT_F10_OP_BUSINESSANALYSIS",
+        "columns": "SECUCODE,SECURITY_CODE,REPORT_DATE,BUSINESS_REVIEW",
+        "pageNumber": 1,
+        "pageSize": 1,
+        "source": "HSF10",
+        "client": "PC"
+    }
+    MAIN_BUSINESS_PARAMS = {
+        "reportName": "RPT_F10_FN_MAINOP",
+        "columns": "SECUCODE,SECURITY_CODE,REPORT_DATE,MAINOP_TYPE,ITEM_NAME,MAIN_BUSINESS_INCOME,MBI_RATIO,MAIN_BUSINESS_COST,MBC_RATIO,MAIN_BUSINESS_RPOFIT,MBR_RATIO,GROSS_RPOFIT_RATIO,RANK",
+        "pageNumber": 1,
+        "pageSize": 200,
+        "source": "HSF10",
+        "client": "PC"
+    }
+
+    # 响应缓存有效期（秒）：经营范围极少变化，报告期按季度更新
+    BUSINESS_SCOPE_CACHE_TTL = 86400
+    REPORT_DATES_CACHE_TTL = 3600
+    MAIN_BUSINESS_CACHE_TTL = 3600
+
+    __slots__ = ()
 
     def __init__(
             self,
@@ -33,26 +80,6 @@ class FundamentalDataCrawler(EastMoneyBaseSpider):
         """
         super().__init__(session, timeout)
 
-    @staticmethod
-    def _parse_jsonp_custom(text: str) -> Optional[Dict]:
-        """
-        解析 JSONP 响应 (自定义版本，适配东方财富API)
-        
-        :param text: 形如 callback({...}) 的字符串
-        :return: 解析后的字典，失败返回 None
-        """
-        # 使用更宽松的正则表达式匹配东方财富的JSONP格式
-        match = re.search(r'^.+?\((.*)\);$', text.strip(), re.DOTALL)
-        if not match:
-            # 如果上面的模式不匹配，尝试原始模式
-            match = re.search(r'^\w+\((.*)\)$', text.strip(), re.DOTALL)
-            if not match:
-                return None
-        try:
-            return json.loads(match.group(1))
-        except json.JSONDecodeError:
-            return None
-
     def get_main_financial_data(self, stock_code: str) -> Optional[Dict[Any, Any]]:
         """
         获取公司主要财务数据
@@ -77,37 +104,25 @@ class FundamentalDataCrawler(EastMoneyBaseSpider):
             "cb": callback
         }
         
-        # 保存原始headers
-        original_headers = self.headers.copy()
-        
-        # 添加特定于该API的请求头
-        self.headers.update({
-            "Referer": "https://www.eastmoney.com/",
-            "Host": "push2.eastmoney.com"
-        })
-        
         try:
-            response = self._get(self.MAIN_DATA_URL, params)
-            # 检查响应是否成功
-            if response.status_code == 200:
-                parsed_response = self._parse_jsonp_custom(response.text)
-                if parsed_response and parsed_response.get("rc") == 0:
-                    # 只要rc为0就认为请求成功，即使data为空也应该返回
-                    if "data" in parsed_response:
-                        return parsed_response["data"]
-                    else:
-                        return {}
-                else:
-                    # 如果不成功，返回错误信息
-                    message = parsed_response.get("message", "未知错误") if parsed_response else "未知错误"
-                    return {"error": message}
+            response = self._get(self.MAIN_DATA_URL, params, headers=self.MAIN_DATA_HEADERS)
+        except requests.RequestException as e:
+            raise CrawlerError(str(e)) from e
+
+        # 检查响应是否成功
+        if response.status_code != 200:
+            raise CrawlerError(f"HTTP错误: {response.status_code}")
+
+        parsed_response = self._parse_jsonp(response.content)
+        if parsed_response and parsed_response.get("rc") == 0:
+            # 只要rc为0就认为请求成功，即使data为空也应该返回
+            if "data" in parsed_response:
+                return parsed_response["data"]
             else:
-                return {"error": f"HTTP错误: {response.status_code}"}
-        except Exception as e:
-            return {"error": str(e)}
-        finally:
-            # 恢复原始headers
-            self.headers = original_headers
+                return {}
+
+        message = parsed_response.get("message", "未知错误") if parsed_response else "未知错误"
+        raise CrawlerError(message)
 
     def get_report_dates(self, stock_code: str) -> Optional[List[Dict[Any, Any]]]:
         """
@@ -116,30 +131,10 @@ class FundamentalDataCrawler(EastMoneyBaseSpider):
         :param stock_code: 股票代码，要在数字后加上交易所代码，格式如688041.SH
         :return: 报告日期列表
         """
-        params = {
-            "reportName": "RPT_F10_FN_MAINOP",
-            "columns": "SECUCODE,REPORT_DATE",
-            "distinct": "REPORT_DATE",
-            "filter": f'(SECUCODE="{stock_code}")',
-            "pageNumber": 1,
-            "pageSize": "",
-            "sortTypes": "-1",
-            "sortColumns": "REPORT_DATE",
-            "source": "HSF10",
-            "client": "PC"
-        }
+        params = {**self.REPORT_DATE_PARAMS, "filter": f'(SECUCODE="{stock_code}")'}
         
-        try:
-            response = self._get_json(self.REPORT_DATE_URL, params)
-            # 检查响应是否成功
-            if response.get("code") == 0 and response.get("success") is True and response.get("result"):
-                return response["result"]["data"]
-            else:
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误")
-                return [{"error": message}]
-        except Exception as e:
-            return [{"error": str(e)}]
+        response = self._get_json(self.REPORT_DATE_URL, params, cache_ttl=self.REPORT_DATES_CACHE_TTL)
+        return self._result_data(response)
 
     def get_business_scope(self, stock_code: str) -> Optional[Dict[Any, Any]]:
         """
@@ -148,27 +143,11 @@ class FundamentalDataCrawler(EastMoneyBaseSpider):
         :param stock_code: 股票代码，要在数字后加上交易所代码，格式如688041.SH
         :return: 主营业务范围数据字典
         """
-        params = {
-            "reportName": "RPT_HSF9_BASIC_ORGINFO",
-            "columns": "SECUCODE,SECURITY_CODE,BUSINESS_SCOPE",
-            "filter": f'(SECUCODE="{stock_code}")',
-            "pageNumber": 1,
-            "pageSize": 1,
-            "source": "HSF10",
-            "client": "PC"
-        }
+        params = {**self.BUSINESS_SCOPE_PARAMS, "filter": f'(SECUCODE="{stock_code}")'}
         
-        try:
-            response = self._get_json(self.BUSINESS_SCOPE_URL, params)
-            # 检查响应是否成功
-            if response.get("code") == 0 and response.get("success") is True and response.get("result"):
-                return response["result"]["data"][0] if response["result"]["data"] else None
-            else:
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误")
-                return {"error": message}
-        except Exception as e:
-            return {"error": str(e)}
+        response = self._get_json(self.BUSINESS_SCOPE_URL, params, cache_ttl=self.BUSINESS_SCOPE_CACHE_TTL)
+        data = self._result_data(response)
+        return data[0] if data else None
 
     def get_business_review(self, stock_code: str) -> Optional[Dict[Any, Any]]:
         """
@@ -177,28 +156,11 @@ class FundamentalDataCrawler(EastMoneyBaseSpider):
         :param stock_code: 股票代码，要在数字后加上交易所代码，格式如688041.SH
         :return: 经营评述数据字典
         """
-        params = {
-            "reportName": "RPT_F10_OP_BUSINESSANALYSIS",
-            "columns": "SECUCODE,SECURITY_CODE,REPORT_DATE,BUSINESS_REVIEW",
-            "filter": f'(SECUCODE="{stock_code}")',
-            "pageNumber": 1,
-            "pageSize": 1,
-            "source": "HSF10",
-            "client": "PC"
-        }
+        params = {**self.BUSINESS_REVIEW_PARAMS, "filter": f'(SECUCODE="{stock_code}")'}
         
-        try:
-            response = self._get_json(self.BUSINESS_REVIEW_URL, params)
-            # 检查响应是否成功
-            if response.get("code") == 0 and response.get("success") is True and response.get("result"):
-                return response["result"]["data"][0] if response["result"]["data"] else None
-            else:
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误")
-                return {"error": message}
-        except Exception as e:
-            return {"error": str(e)}
-
+        response = self._get_json(self.BUSINESS_REVIEW_URL, params)
+        data = self._result_data(response)
+        return data[0] if data else None
 
     def get_main_business(self, stock_code: str, report_date: Optional[str] = None) -> Optional[List[Dict[Any, Any]]]:
         """
@@ -215,26 +177,69 @@ class FundamentalDataCrawler(EastMoneyBaseSpider):
         if report_date:
             filter_param += f'(REPORT_DATE=\'{report_date}\')'
         
+        return self._query_main_business(filter_param, "1,1", "MAINOP_TYPE,RANK")
+
+    def _get_latest_main_business(self, stock_code: str) -> List[Dict[Any, Any]]:
+        """
+        获取全部报告期的主营构成，按报告日期倒序，最新一期排在最前
+
+        :param stock_code: 股票代码，要在数字后加上交易所代码，格式如688041.SH
+        :return: 主营业务构成数据列表
+        """
+        filter_param = f'(SECUCODE="{stock_code}")'
+        return self._query_main_business(filter_param, "-1,1,1", "REPORT_DATE,MAINOP_TYPE,RANK")
+
+    def _query_main_business(self, filter_param: str, sort_types: str, sort_columns: str) -> List[Dict[Any, Any]]:
         params = {
-            "reportName": "RPT_F10_FN_MAINOP",
-            "columns": "SECUCODE,SECURITY_CODE,REPORT_DATE,MAINOP_TYPE,ITEM_NAME,MAIN_BUSINESS_INCOME,MBI_RATIO,MAIN_BUSINESS_COST,MBC_RATIO,MAIN_BUSINESS_RPOFIT,MBR_RATIO,GROSS_RPOFIT_RATIO,RANK",
+            **self.MAIN_BUSINESS_PARAMS,
             "filter": filter_param,
-            "pageNumber": 1,
-            "pageSize": 200,
-            "sortTypes": "1,1",
-            "sortColumns": "MAINOP_TYPE,RANK",
-            "source": "HSF10",
-            "client": "PC"
+            "sortTypes": sort_types,
+            "sortColumns": sort_columns,
         }
         
-        try:
-            response = self._get_json(self.MAIN_BUSINESS_URL, params)
-            # 检查响应是否成功
-            if response.get("code") == 0 and response.get("success") is True and response.get("result"):
-                return response["result"]["data"]
-            else:
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误")
-                return [{"error": message}]
-        except Exception as e:
-            return [{"error": str(e)}]
\ No newline at end of file
+        response = self._get_json(self.MAIN_BUSINESS_URL, params, cache_ttl=self.MAIN_BUSINESS_CACHE_TTL)
+        return self._result_data(response)
+
+    def get_fundamental_bundle(self, stock_code: str, include_scope: bool = True) -> Dict[str, Any]:
+        """
+        并发获取报告日期、主营业务范围和最新一期主营构成
+
+        各报表互不依赖，在共享连接池上并发请求，耗时约为单次请求。
+        主营构成不带日期过滤、按报告日期倒序返回，这里只保留最新一期。
+
+        :param stock_code: 股票代码，要在数字后加上交易所代码，格式如688041.SH
+        :param include_scope: 是否同时获取主营业务范围，为 False 时不发出该请求
+        :return: {"report_dates": ..., "business_scope": ..., "main_business": ..., "main_business_date": ...}，
+                 前三个字段与对应单项方法的返回值格式一致，经营范围未获取或获取失败时为 None；
+                 main_business_date 为 main_business 实际所属的报告日期，无主营构成数据时为 None
+        :raises CrawlerError: 报告日期或主营构成获取失败
+        """
+        fetches = [
+            lambda: self.get_report_dates(stock_code),
+            lambda: self._get_latest_main_business(stock_code),
+        ]
+        if include_scope:
+            fetches.append(lambda: self.get_business_scope(stock_code))
+        results = self._gather(*fetches, return_exceptions=True)
+        report_dates, main_business = results[0], results[1]
+        business_scope = results[2] if include_scope else None
+
+        # 报告日期和主营构成是必需数据，失败时直接抛出；经营范围失败不影响其余数据
+        for result in (report_dates, main_business):
+            if isinstance(result, Exception):
+                raise result
+        if isinstance(business_scope, Exception):
+            logger.warning(f"获取 {stock_code} 主营业务范围失败: {business_scope}")
+            business_scope = None
+
+        latest_date = None
+        if main_business:
+            latest_date = main_business[0].get("REPORT_DATE")
+            main_business = [item for item in main_business if item.get("REPORT_DATE") == latest_date]
+
+        return {
+            "report_dates": report_dates,
+            "business_scope": business_scope,
+            "main_business": main_business,
+            "main_business_date": latest_date,
+        }
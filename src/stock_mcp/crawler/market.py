@@ -1,6 +1,8 @@
+import time
+
 import requests
 from typing import Dict, List, Optional
-from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider
+from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider, CrawlerError
 
 class MarketSpider(EastMoneyBaseSpider):
     """
@@ -9,6 +11,69 @@ class MarketSpider(EastMoneyBaseSpider):
     用于获取东方财富网的板块行情数据，包括行业板块、概念板块、地域板块等。
     """
 
+    # 响应缓存有效期（秒）
+    PLATE_QUOTATION_CACHE_TTL = 2
+    FUND_FLOW_CACHE_TTL = 60
+    # 当日龙虎榜在收盘后陆续公布，短时缓存；历史交易日的龙虎榜不再变化
+    BILLBOARD_CACHE_TTL = 300
+    CLOSED_BILLBOARD_CACHE_TTL = 86400
+
+    # 各接口的固定请求参数，调用时只补充分页、代码、callback 等动态字段
+    PLATE_QUOTATION_PARAMS = {
+        "np": "1",
+        "fltt": "1",
+        "invt": "2",
+        "fields": "f12,f13,f14,f1,f2,f4,f3,f152,f20,f8,f104,f105,f128,f140,f141,f207,f208,f209,f136,f222",
+        "fid": "f3",
+        "pn": "1",
+        "po": "1",
+        "ut": "fa5fd1943c7b386f172d6893dbfba10b",
+        "dect": "1",
+        "wbp2u": "|0|0|0|web",
+    }
+    PLATE_FUND_FLOW_PARAMS = {
+        "np": "1",
+        "fltt": "2",
+        "invt": "2",
+        "fields": "f12,f14,f2,f3,f62,f184,f66,f69,f72,f75,f78,f81,f84,f87,f204,f205,f124,f1,f13",
+        "fid": "f62",
+        "pn": "1",
+        "po": "1",
+        "ut": "8dec03ba335b81bf4ebdf7b29ec27d15",
+    }
+    HISTORICAL_FUND_FLOW_PARAMS = {
+        "klt": "101",
+        "fields1": "f1,f2,f3,f7",
+        "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61,f62,f63,f64,f65",
+        "ut": "b2884a393a59ad64002292a3e90d46a5",
+    }
+    BILLBOARD_PARAMS = {
+        "sortColumns": "CHANGE_RATE,TRADE_DATE,SECURITY_CODE",
+        "sortTypes": "-1,-1,1",
+        "pageNumber": "1",
+        "reportName": "RPT_DAILYBILLBOARD_DETAILSNEW",
+        "columns": "SECURITY_CODE,SECUCODE,SECURITY_NAME_ABBR,TRADE_DATE,EXPLAIN,CLOSE_PRICE,CHANGE_RATE,"
+                   "BILLBOARD_NET_AMT,BILLBOARD_BUY_AMT,BILLBOARD_SELL_AMT,BILLBOARD_DEAL_AMT,ACCUM_AMOUNT,"
+                   "DEAL_NET_RATIO,DEAL_AMOUNT_RATIO,TURNOVERRATE,FREE_MARKET_CAP,EXPLANATION,D1_CLOSE_ADJCHRATE,"
+                   "D2_CLOSE_ADJCHRATE,D5_CLOSE_ADJCHRATE,D10_CLOSE_ADJCHRATE,SECURITY_TYPE_CODE",
+        "source": "WEB",
+        "client": "WEB",
+    }
+    STOCK_BILLBOARD_PARAMS = {
+        "sortColumns": "TRADE_DATE,TRADE_DATE",
+        "sortTypes": "-1,-1",
+        "pageNumber": "1",
+        "reportName": "RPT_BILLBOARD_PERFORMANCEHIS",
+        # 只取用到的字段，避免 ALL 返回整张宽表
+        "columns": "SECURITY_CODE,SECUCODE,SECURITY_NAME_ABBR,TRADE_DATE,EXPLAIN,CLOSE_PRICE,CHANGE_RATE,"
+                   "NET_BUY_AMT,NET_SELL_AMT,NET_OPERATEDEPT_AMT,D1_CLOSE_ADJCHRATE,D2_CLOSE_ADJCHRATE,"
+                   "D3_CLOSE_ADJCHRATE,D5_CLOSE_ADJCHRATE,D10_CLOSE_ADJCHRATE,D20_CLOSE_ADJCHRATE,D30_CLOSE_ADJCHRATE",
+        "source": "WEB",
+        "client": "WEB",
+    }
+
+    __slots__ = ("base_url", "fund_flow_url", "billboard_url", "bk_changes_url", "macroeconomic_url")
+
     def __init__(
             self,
             session: Optional[requests.Session] = None,
@@ -36,23 +101,15 @@ class MarketSpider(EastMoneyBaseSpider):
         fs_param = f"m:90 t:{plate_type} f:!50"
         
         params = {
-            "np": "1",
-            "fltt": "1",
-            "invt": "2",
+            **self.PLATE_QUOTATION_PARAMS,
             "cb": self._generate_callback(),
             "fs": fs_param,
-            "fields": "f12,f13,f14,f1,f2,f4,f3,f152,f20,f8,f104,f105,f128,f140,f141,f207,f208,f209,f136,f222",
-            "fid": "f3",
-            "pn": "1",
             "pz": str(page_size),
-            "po": "1",
-            "ut": "fa5fd1943c7b386f172d6893dbfba10b",
-            "dect": "1",
-            "wbp2u": "|0|0|0|web",
-            "_": str(self._timestamp_ms())
+            "_": self._cache_buster()
         }
 
-        response = self._get_jsonp(self.base_url, params)
+        # 盘中行情常被连续轮询，短时间内的重复请求直接复用结果
+        response = self._get_jsonp(self.base_url, params, cache_ttl=self.PLATE_QUOTATION_CACHE_TTL)
         
         if response and response.get("data") and response["data"].get("diff"):
             return response["data"]["diff"]
@@ -74,18 +131,11 @@ class MarketSpider(EastMoneyBaseSpider):
         fs_param = f"m:90 t:{plate_type}"
         
         params = {
-            "np": "1",
-            "fltt": "2",
-            "invt": "2",
+            **self.PLATE_FUND_FLOW_PARAMS,
             "cb": self._generate_callback(),
             "fs": fs_param,
-            "fields": "f12,f14,f2,f3,f62,f184,f66,f69,f72,f75,f78,f81,f84,f87,f204,f205,f124,f1,f13",
-            "fid": "f62",
-            "pn": "1",
             "pz": str(page_size),
-            "po": "1",
-            "ut": "8dec03ba335b81bf4ebdf7b29ec27d15",
-            "_": str(self._timestamp_ms())
+            "_": self._cache_buster()
         }
 
         response = self._get_jsonp(self.base_url, params)
@@ -105,17 +155,14 @@ class MarketSpider(EastMoneyBaseSpider):
         """
         secid = self.format_secid(stock_code)
         params = {
+            **self.HISTORICAL_FUND_FLOW_PARAMS,
             "lmt": str(limit),
-            "klt": "101",
-            "fields1": "f1,f2,f3,f7",
-            "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61,f62,f63,f64,f65",
-            "ut": "b2884a393a59ad64002292a3e90d46a5",
             "secid": secid,
             "cb": self._generate_callback(),
-            "_": str(self._timestamp_ms())
+            "_": self._cache_buster()
         }
         
-        response = self._get_jsonp(self.fund_flow_url, params)
+        response = self._get_jsonp(self.fund_flow_url, params, cache_ttl=self.FUND_FLOW_CACHE_TTL)
         
         if response and response.get("data"):
             return response["data"]
@@ -131,32 +178,27 @@ class MarketSpider(EastMoneyBaseSpider):
         :return: 包含龙虎榜数据或错误信息的字典
         """
         params = {
-            "sortColumns": "CHANGE_RATE,TRADE_DATE,SECURITY_CODE",
-            "sortTypes": "-1,-1,1",
+            **self.BILLBOARD_PARAMS,
             "pageSize": str(page_size),
-            "pageNumber": "1",
-            "reportName": "RPT_DAILYBILLBOARD_DETAILSNEW",
-            "columns": "SECURITY_CODE,SECUCODE,SECURITY_NAME_ABBR,TRADE_DATE,EXPLAIN,CLOSE_PRICE,CHANGE_RATE,"
-                      "BILLBOARD_NET_AMT,BILLBOARD_BUY_AMT,BILLBOARD_SELL_AMT,BILLBOARD_DEAL_AMT,ACCUM_AMOUNT,"
-                      "DEAL_NET_RATIO,DEAL_AMOUNT_RATIO,TURNOVERRATE,FREE_MARKET_CAP,EXPLANATION,D1_CLOSE_ADJCHRATE,"
-                      "D2_CLOSE_ADJCHRATE,D5_CLOSE_ADJCHRATE,D10_CLOSE_ADJCHRATE,SECURITY_TYPE_CODE",
-            "source": "WEB",
-            "client": "WEB",
             "callback": self._generate_callback(),
-            "_": str(self._timestamp_ms())
+            "_": self._cache_buster()
         }
         
         if trade_date:
             params["filter"] = f"(TRADE_DATE='{trade_date}')"
 
-        response = self._get_jsonp(self.billboard_url, params)
+        if trade_date and trade_date < time.strftime("%Y-%m-%d"):
+            cache_ttl = self.CLOSED_BILLBOARD_CACHE_TTL
+        else:
+            cache_ttl = self.BILLBOARD_CACHE_TTL
+        response = self._get_jsonp(self.billboard_url, params, cache_ttl=cache_ttl)
         
         if response and response.get("result") and response["result"].get("data"):
             return response["result"]["data"]
         elif response:
-            return [{"error": response.get("message", "未知错误")}]
+            raise CrawlerError(response.get("message", "未知错误"))
         else:
-            return [{"error": "网络请求失败"}]
+            raise CrawlerError("网络请求失败")
     
     def get_stock_billboard_data(self, stock_code: str, page_size: int = 10) -> list[dict]:
         """
@@ -167,16 +209,10 @@ class MarketSpider(EastMoneyBaseSpider):
         :return: 包含龙虎榜历史数据或错误信息的列表
         """
         params = {
-            "sortColumns": "TRADE_DATE,TRADE_DATE",
-            "sortTypes": "-1,-1",
+            **self.STOCK_BILLBOARD_PARAMS,
             "pageSize": page_size,
-            "pageNumber": "1",
-            "reportName": "RPT_BILLBOARD_PERFORMANCEHIS",
-            "columns": "ALL",
-            "source": "WEB",
-            "client": "WEB",
             "callback": self._generate_callback(),
-            "_": str(self._timestamp_ms())
+            "_": self._cache_buster()
         }
         # 移除股票代码后缘
         stock_code = stock_code.split(".")[0]
@@ -188,9 +224,9 @@ class MarketSpider(EastMoneyBaseSpider):
         if response and response.get("result") and response["result"].get("data"):
             return response["result"]["data"]
         elif response:
-            return [{"error": response.get("message", "未知错误")}]
+            raise CrawlerError(response.get("message", "未知错误"))
         else:
-            return [{"error": "网络请求失败"}]
+            raise CrawlerError("网络请求失败")
 
     def get_current_plate_changes(self, page_size: int = 10) -> Optional[List[Dict]]:
         """
@@ -205,7 +241,7 @@ class MarketSpider(EastMoneyBaseSpider):
             "dpt": "wzchanges",
             "pageindex": "0",
             "pagesize": str(page_size),
-            "_": str(self._timestamp_ms())
+            "_": self._cache_buster()
         }
 
         response = self._get_jsonp(self.bk_changes_url, params)
@@ -230,7 +266,7 @@ class MarketSpider(EastMoneyBaseSpider):
             "cb": self._generate_callback(),
             "ut": "7eea3edcaed734bea9cbfc24409ed989",
             "dpt": "wzchanges",
-            "_": str(self._timestamp_ms())
+            "_": self._cache_buster()
         }
 
         response = self._get_jsonp(count_changes_url, params)
@@ -260,7 +296,7 @@ class MarketSpider(EastMoneyBaseSpider):
             "fields": "",
             "orgCode": "",
             "author": "",
-            "_": str(self._timestamp_ms())
+            "_": self._cache_buster()
         }
 
         response = self._get_json(self.macroeconomic_url, params)
@@ -301,6 +337,6 @@ class MarketSpider(EastMoneyBaseSpider):
         if response and response.get("result") and response["result"].get("data"):
             return response["result"]["data"]
         elif response:
-            return [{"error": response.get("message", "未知错误")}]
+            raise CrawlerError(response.get("message", "未知错误"))
         else:
-            return [{"error": "网络请求失败"}]
+            raise CrawlerError("网络请求失败")
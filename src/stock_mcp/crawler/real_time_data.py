@@ -1,9 +1,11 @@
-import time
+import logging
 
 import requests
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable
 from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider
 
+logger = logging.getLogger(__name__)
+
 
 class RealTimeDataSpider(EastMoneyBaseSpider):
     """
@@ -15,6 +17,10 @@ class RealTimeDataSpider(EastMoneyBaseSpider):
     MARKET_INDEX_URL = "https://push2.eastmoney.com/api/qt/ulist.np/get"
     REAL_TIME_DATA_URL = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
 
+    # 行情快照约每 3 秒刷新一次，同一时间窗口内的重复调用直接复用
+    REAL_TIME_CACHE_TTL = 3
+
+    __slots__ = ()
 
     def __init__(
             self,
@@ -44,10 +50,10 @@ class RealTimeDataSpider(EastMoneyBaseSpider):
             "fqt": "1",
             "end": "20500101",
             "lmt": "1",
-            "_": str(int(time.time() * 1000))
+            "_": self._cache_buster()
         }
         
-        response = self._get_jsonp(self.REAL_TIME_DATA_URL, params)
+        response = self._get_jsonp(self.REAL_TIME_DATA_URL, params, cache_ttl=self.REAL_TIME_CACHE_TTL)
         
         if response is None:
             raise Exception("获取实时数据失败: 无法解析响应")
@@ -59,6 +65,27 @@ class RealTimeDataSpider(EastMoneyBaseSpider):
         data = response.get("data", {})
         return data
 
+    def get_real_time_data_many(self, symbols: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        批量获取多只股票的实时数据（并发请求）
+
+        :param symbols: 股票代码列表，格式同 get_real_time_data
+        :return: {股票代码: 实时数据}，获取失败的股票不包含在结果中
+        """
+        symbols = list(dict.fromkeys(symbols))
+        results = self._gather(
+            *[lambda s=symbol: self.get_real_time_data(s) for symbol in symbols],
+            return_exceptions=True,
+        )
+
+        data_map = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.warning(f"获取 {symbol} 实时数据失败: {result}")
+                continue
+            data_map[symbol] = result
+        return data_map
+
     def get_real_time_market_indices(self) -> List[Dict]:
         """
         获取实时大盘指数数据
@@ -69,10 +96,10 @@ class RealTimeDataSpider(EastMoneyBaseSpider):
             "ut": "13697a1cc677c8bfa9a496437bfef419",
             "fields": "f1,f2,f3,f4,f12,f13,f14",
             "secids": "1.000001,1.000016,1.000300,1.000003,1.000688,0.399001,0.399006,0.399106,0.399003",
-            "_": str(int(time.time() * 1000))
+            "_": self._cache_buster()
         }
         
-        response = self._get_json(self.MARKET_INDEX_URL, params)
+        response = self._get_json(self.MARKET_INDEX_URL, params, cache_ttl=self.REAL_TIME_CACHE_TTL)
         rc = response.get("rc", -1)
         
         if rc != 0:
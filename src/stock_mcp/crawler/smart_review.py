@@ -1,4 +1,4 @@
-from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider
+from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider, CrawlerError
 
 import requests
 from typing import Optional, Dict, Any, List
@@ -17,6 +17,8 @@ class SmartReviewCrawler(EastMoneyBaseSpider):
     MAIN_FORCE_CONTROL_URL = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     PARTICIPATION_WISH_URL = "https://datacenter-web.eastmoney.com/api/data/v1/get"
 
+    __slots__ = ()
+
     def __init__(
             self,
             session: Optional[requests.Session] = None,
@@ -56,19 +58,16 @@ class SmartReviewCrawler(EastMoneyBaseSpider):
             "pageSize": "30"
         }
         
-        try:
-            response = self._get_jsonp(self.PARTICIPATION_WISH_URL, params)
-            
-            # 检查响应是否成功
-            if response and response.get("code") == 0 and response.get("success") is True:
-                data = response.get("result", {}).get("data", [])
-                return data if data else []
-            else:
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误") if response else "未知错误"
-                return [{"error": message}]
-        except Exception as e:
-            return [{"error": str(e)}]
+        response = self._get_jsonp(self.PARTICIPATION_WISH_URL, params)
+        
+        # 检查响应是否成功
+        if response and response.get("code") == 0 and response.get("success") is True:
+            data = (response.get("result") or {}).get("data") or []
+            return data if data else []
+
+        # 如果不成功，抛出错误信息
+        message = response.get("message", "未知错误") if response else "未知错误"
+        raise CrawlerError(message)
 
     def get_main_force_control(self, stock_code: str) -> Optional[List[Dict[Any, Any]]]:
         """
@@ -95,19 +94,16 @@ class SmartReviewCrawler(EastMoneyBaseSpider):
             "sortTypes": "1"
         }
         
-        try:
-            response = self._get_jsonp(self.MAIN_FORCE_CONTROL_URL, params)
-            
-            # 检查响应是否成功
-            if response and response.get("code") == 0 and response.get("success") is True:
-                data = response.get("result", {}).get("data", [])
-                return data if data else []
-            else:
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误") if response else "未知错误"
-                return [{"error": message}]
-        except Exception as e:
-            return [{"error": str(e)}]
+        response = self._get_jsonp(self.MAIN_FORCE_CONTROL_URL, params)
+        
+        # 检查响应是否成功
+        if response and response.get("code") == 0 and response.get("success") is True:
+            data = (response.get("result") or {}).get("data") or []
+            return data if data else []
+
+        # 如果不成功，抛出错误信息
+        message = response.get("message", "未知错误") if response else "未知错误"
+        raise CrawlerError(message)
 
     def get_smart_score(self, stock_code: str) -> Optional[Dict[Any, Any]]:
         """
@@ -142,35 +138,45 @@ class SmartReviewCrawler(EastMoneyBaseSpider):
             "pageSize": "1"
         }
         
-        try:
-            response = self._get_jsonp(self.SMART_SCORE_URL, params)
-            additional_response = self._get_jsonp(self.SMART_SCORE_URL, additional_params)
+        # 智能评分每个交易日收盘后才更新，缓存到下一次刷新
+        ttl = self._daily_cache_ttl()
+
+        # 两个报表互不依赖，并发请求
+        response, additional_response = self._gather(
+            lambda: self._get_jsonp(self.SMART_SCORE_URL, params, cache_ttl=ttl),
+            lambda: self._get_jsonp(self.SMART_SCORE_URL, additional_params, cache_ttl=ttl),
+            return_exceptions=True,
+        )
+        if isinstance(response, Exception):
+            raise response
+        # 补充数据获取失败不影响评分结果
+        if isinstance(additional_response, Exception):
+            additional_response = None
+        
+        # 检查响应是否成功
+        if response and response.get("code") == 0 and response.get("success") is True:
+            data = (response.get("result") or {}).get("data") or []
+            # 响应可能来自共享缓存，复制后再合并，避免修改缓存中的对象
+            result = dict(data[0]) if data else {}
             
-            # 检查响应是否成功
-            if response and response.get("code") == 0 and response.get("success") is True:
-                data = response.get("result", {}).get("data", [])
-                result = data[0] if data else {}
-                
-                # 添加额外的数据
-                if additional_response and additional_response.get("code") == 0 and additional_response.get("success") is True:
-                    additional_data = additional_response.get("result", {}).get("data", [])
-                    if additional_data:
-                        additional_info = additional_data[0]
-                        result.update({
-                            "SECURITY_NAME_ABBR":  additional_info.get("SECURITY_NAME_ABBR"),
-                            "RISE_1_PROBABILITY": additional_info.get("RISE_1_PROBABILITY"),
-                            "AVERAGE_1_INCREASE": additional_info.get("AVERAGE_1_INCREASE"),
-                            "RISE_5_PROBABILITY": additional_info.get("RISE_5_PROBABILITY"),
-                            "AVERAGE_5_INCREASE": additional_info.get("AVERAGE_5_INCREASE")
-                        })
-                
-                return result if result else None
-            else:
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误") if response else "未知错误"
-                return {"error": message}
-        except Exception as e:
-            return {"error": str(e)}
+            # 添加额外的数据
+            if additional_response and additional_response.get("code") == 0 and additional_response.get("success") is True:
+                additional_data = (additional_response.get("result") or {}).get("data") or []
+                if additional_data:
+                    additional_info = additional_data[0]
+                    result.update({
+                        "SECURITY_NAME_ABBR":  additional_info.get("SECURITY_NAME_ABBR"),
+                        "RISE_1_PROBABILITY": additional_info.get("RISE_1_PROBABILITY"),
+                        "AVERAGE_1_INCREASE": additional_info.get("AVERAGE_1_INCREASE"),
+                        "RISE_5_PROBABILITY": additional_info.get("RISE_5_PROBABILITY"),
+                        "AVERAGE_5_INCREASE": additional_info.get("AVERAGE_5_INCREASE")
+                    })
+            
+            return result if result else None
+
+        # 如果不成功，抛出错误信息
+        message = response.get("message", "未知错误") if response else "未知错误"
+        raise CrawlerError(message)
 
     def get_smart_score_rank(self, stock_code: str) -> Optional[Dict[Any, Any]]:
         """
@@ -195,19 +201,17 @@ class SmartReviewCrawler(EastMoneyBaseSpider):
             "reportName": "RPT_STOCK_PK_RANK"
         }
         
-        try:
-            response = self._get_jsonp(self.SMART_SCORE_URL, params)
-            
-            # 检查响应是否成功
-            if response and response.get("code") == 0 and response.get("success") is True:
-                data = response.get("result", {}).get("data", [])
-                return data[0] if data else None
-            else:
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误") if response else "未知错误"
-                return {"error": message}
-        except Exception as e:
-            return {"error": str(e)}
+        # 评分排名为日频报表，缓存到下一次收盘后刷新
+        response = self._get_jsonp(self.SMART_SCORE_URL, params, cache_ttl=self._daily_cache_ttl())
+        
+        # 检查响应是否成功
+        if response and response.get("code") == 0 and response.get("success") is True:
+            data = (response.get("result") or {}).get("data") or []
+            return data[0] if data else None
+
+        # 如果不成功，抛出错误信息
+        message = response.get("message", "未知错误") if response else "未知错误"
+        raise CrawlerError(message)
 
     def get_top_rated_stocks(self, page_size: int = 10) -> Optional[List[Dict[Any, Any]]]:
         """
@@ -231,16 +235,13 @@ class SmartReviewCrawler(EastMoneyBaseSpider):
             "pageSize": str(page_size)
         }
         
-        try:
-            response = self._get_jsonp(self.SMART_SCORE_URL, params)
-            
-            # 检查响应是否成功
-            if response and response.get("code") == 0 and response.get("success") is True:
-                data = response.get("result", {}).get("data", [])
-                return data if data else []
-            else:
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误") if response else "未知错误"
-                return [{"error": message}]
-        except Exception as e:
-            return [{"error": str(e)}]
\ No newline at end of file
+        response = self._get_jsonp(self.SMART_SCORE_URL, params, cache_ttl=self._daily_cache_ttl())
+        
+        # 检查响应是否成功
+        if response and response.get("code") == 0 and response.get("success") is True:
+            data = (response.get("result") or {}).get("data") or []
+            return data if data else []
+
+        # 如果不成功，抛出错误信息
+        message = response.get("message", "未知错误") if response else "未知错误"
+        raise CrawlerError(message)
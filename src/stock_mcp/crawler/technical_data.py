@@ -1,7 +1,15 @@
+import logging
+import time
+
 from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider
 
 import requests
-from typing import List, Optional, Dict, Any
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Iterable
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
 
 class KlineSpider(EastMoneyBaseSpider):
     """
@@ -16,6 +24,16 @@ class KlineSpider(EastMoneyBaseSpider):
     TECHNICAL_INDICATORS_URL = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     PKYD_URL = "https://push2.eastmoney.com/api/qt/pkyd/get"  # 盘口异动API
 
+    DEFAULT_HEADERS = MappingProxyType({**EastMoneyBaseSpider.DEFAULT_HEADERS, "Referer": "https://quote.eastmoney.com/"})
+
+    # K 线接口的固定查询参数，类定义时编码一次
+    KLINE_URL_PREFIX = BASE_URL + "?" + urlencode({
+        "fields1": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f11,f12,f13",
+        "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61",
+        "ut": "fa5fd1943c7b386f172d6893dbfba10b",
+        "rtntype": "6",
+    })
+
     # K线周期常量
     KLT_1MIN = 1
     KLT_5MIN = 5
@@ -26,18 +44,25 @@ class KlineSpider(EastMoneyBaseSpider):
     KLT_WEEK = 102
     KLT_MONTH = 103
 
+    # 结束日期早于今天的不复权 K 线区间不会再变化，缓存一天；
+    # 复权价格会在除权除息日整体重算，已结束区间也只缓存到下一次日频刷新；
+    # 包含今天的区间盘中仍在变化，只做短时缓存合并重复调用
+    CLOSED_KLINE_CACHE_TTL = 86400
+    OPEN_KLINE_CACHE_TTL = 10
+
     # 复权方式常量
     FQT_NONE = 0  # 不复权
     FQT_FORWARD = 1  # 前复权
     FQT_BACKWARD = 2  # 后复权
 
+    __slots__ = ()
+
     def __init__(
             self,
             session: Optional[requests.Session] = None,
             timeout: int = 20,
     ):
         super().__init__(session, timeout)
-        self.headers["Referer"] = "https://quote.eastmoney.com/"
 
     def get_klines(
             self,
@@ -59,19 +84,22 @@ class KlineSpider(EastMoneyBaseSpider):
         """
         secid = self.format_secid(stock_code)
 
-        params = {
-            "fields1": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f11,f12,f13",
-            "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61",
+        # 固定参数已预先编码，只编码随调用变化的部分
+        url = f"{self.KLINE_URL_PREFIX}&" + urlencode({
             "beg": beg,
             "end": end,
-            "ut": "fa5fd1943c7b386f172d6893dbfba10b",
-            "rtntype": "6",
             "secid": secid,
-            "klt": str(klt),
-            "fqt": str(fqt),
-        }
-
-        data = self._get_json(self.BASE_URL, params)
+            "klt": klt,
+            "fqt": fqt,
+        })
+
+        if end >= time.strftime("%Y%m%d"):
+            cache_ttl = self.OPEN_KLINE_CACHE_TTL
+        elif fqt == self.FQT_NONE:
+            cache_ttl = self.CLOSED_KLINE_CACHE_TTL
+        else:
+            cache_ttl = self._daily_cache_ttl()
+        data = self._get_json(url, cache_ttl=cache_ttl)
 
         if not data.get("data"):
             raise RuntimeError(f"{secid}响应无 data 字段: {data}")
@@ -82,6 +110,38 @@ class KlineSpider(EastMoneyBaseSpider):
 
         return klines
 
+    def get_klines_many(
+            self,
+            stock_codes: Iterable[str],
+            beg: str = "19000101",
+            end: str = "20500101",
+            klt: int = KLT_DAY,
+            fqt: int = FQT_FORWARD,
+    ) -> Dict[str, List[str]]:
+        """
+        批量获取多只股票的 K 线数据（并发请求）
+
+        :param stock_codes: 股票代码列表，格式同 get_klines
+        :param beg: 开始日期 YYYYMMDD
+        :param end: 结束日期 YYYYMMDD
+        :param klt: K线周期（使用 KLT_* 常量）
+        :param fqt: 复权方式（使用 FQT_* 常量）
+        :return: {股票代码: K线数据列表}，获取失败的股票不包含在结果中
+        """
+        stock_codes = list(dict.fromkeys(stock_codes))
+        results = self._gather(
+            *[lambda c=code: self.get_klines(c, beg, end, klt, fqt) for code in stock_codes],
+            return_exceptions=True,
+        )
+
+        klines_map = {}
+        for code, result in zip(stock_codes, results):
+            if isinstance(result, Exception):
+                logger.warning(f"获取 {code} K线数据失败: {result}")
+                continue
+            klines_map[code] = result
+        return klines_map
+
     def get_technical_indicators(
             self,
             stock_code: str,
@@ -98,11 +158,11 @@ class KlineSpider(EastMoneyBaseSpider):
         if '.' in stock_code:
             stock_code = stock_code.split('.')[0]
 
-        # 获取MACD等技术指标数据
-        macd_data = self._get_macd_data(stock_code, page_size)
-        
-        # 获取趋势量能等额外技术指标数据
-        trend_data = self._get_trend_volume_data(stock_code, page_size)
+        # 并发获取MACD等技术指标数据与趋势量能等额外技术指标数据
+        macd_data, trend_data = self._gather(
+            lambda: self._get_macd_data(stock_code, page_size),
+            lambda: self._get_trend_volume_data(stock_code, page_size),
+        )
         
         # 合并数据
         merged_data = self._merge_technical_data(macd_data, trend_data)
@@ -159,10 +219,11 @@ class KlineSpider(EastMoneyBaseSpider):
             "sortColumns": "TRADEDATE",
             "sortTypes": "-1",
             "pageSize": str(page_size),
-            "_": str(self._timestamp_ms())
+            "_": self._cache_buster()
         }
 
-        response = self._get_jsonp(self.TECHNICAL_INDICATORS_URL, params)
+        # 指标报表为日频数据，缓存到下一次收盘后刷新
+        response = self._get_jsonp(self.TECHNICAL_INDICATORS_URL, params, cache_ttl=self._daily_cache_ttl())
 
         if not response or not response.get("result"):
             raise RuntimeError(f"获取MACD技术指标数据失败: {response}")
@@ -194,10 +255,11 @@ class KlineSpider(EastMoneyBaseSpider):
             "sortColumns": "TRADE_DATE",
             "sortTypes": "-1",
             "pageSize": str(page_size),
-            "_": str(self._timestamp_ms())
+            "_": self._cache_buster()
         }
 
-        response = self._get_jsonp(self.TECHNICAL_INDICATORS_URL, params)
+        # 指标报表为日频数据，缓存到下一次收盘后刷新
+        response = self._get_jsonp(self.TECHNICAL_INDICATORS_URL, params, cache_ttl=self._daily_cache_ttl())
 
         if not response or not response.get("result"):
             raise RuntimeError(f"获取趋势量能技术指标数据失败: {response}")
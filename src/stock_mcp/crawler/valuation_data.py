@@ -1,11 +1,7 @@
-import time
-
-from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider
+from stock_mcp.crawler.base_crawler import EastMoneyBaseSpider, CrawlerError
 
 import requests
 from typing import Optional, Dict, Any, List
-import json
-import re
 
 
 class ValuationDataCrawler(EastMoneyBaseSpider):
@@ -18,6 +14,8 @@ class ValuationDataCrawler(EastMoneyBaseSpider):
     VALUATION_TREND_URL = "https://datacenter.eastmoney.com/securities/api/data/v1/get"
     VALUATION_PERCENTILE_URL = "https://datacenter.eastmoney.com/securities/api/data/v1/get"
     INSTITUTIONAL_RATING_URL = "https://reportapi.eastmoney.com/report/list"
+    # 研报接口校验来源页，需要带上 Referer 更接近浏览器行为
+    INSTITUTIONAL_RATING_HEADERS = {"Referer": "https://data.eastmoney.com/"}
     GROWTH_COMPARISON_URL = "https://datacenter.eastmoney.com/securities/api/data/v1/get"
     VALUATION_COMPARISON_URL = "https://datacenter.eastmoney.com/securities/api/data/v1/get"
     VALUATION_COMPARE_URL = "https://datacenter.eastmoney.com/securities/api/data/v1/get"
@@ -49,6 +47,8 @@ class ValuationDataCrawler(EastMoneyBaseSpider):
         DATE_TYPE_10YEAR: "10年"
     }
 
+    __slots__ = ()
+
     def __init__(
             self,
             session: Optional[requests.Session] = None,
@@ -74,13 +74,6 @@ class ValuationDataCrawler(EastMoneyBaseSpider):
         # 移除股票代码中的交易所后缀（如果存在）
         clean_stock_code = stock_code.split('.')[0] if '.' in stock_code else stock_code
         
-        # 更新headers以更接近浏览器行为
-        headers = self.headers.copy()
-        headers.update({
-            "Referer": "https://data.eastmoney.com/",
-            "Host": "reportapi.eastmoney.com"
-        })
-        
         params = {
             "cb": "datatable1167765",
             "pageNo": 1,
@@ -97,30 +90,21 @@ class ValuationDataCrawler(EastMoneyBaseSpider):
             "p": 1,
             "pageNum": 1,
             "pageNumber": 1,
-            "_": int(round(time.time() * 1000))
+            "_": self._cache_buster()
         }
         
         try:
-            response = self.session.get(
-                self.INSTITUTIONAL_RATING_URL, 
-                params=params, 
-                headers=headers,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            # 提取JSON数据（去除JSONP包装）
-            text = response.text
-            match = re.search(r'datatable1167765\((.*)\)', text)
-            if match:
-                json_str = match.group(1)
-                data = json.loads(json_str)
-                return data.get("data", [])
-            else:
-                return []
-                
-        except Exception as e:
-            return [{"error": f"获取机构评级数据出错: {str(e)}"}]
+            with self._get(self.INSTITUTIONAL_RATING_URL, params, headers=self.INSTITUTIONAL_RATING_HEADERS) as response:
+                response.raise_for_status()
+                content = response.content
+        except requests.RequestException as e:
+            raise CrawlerError(f"获取机构评级数据出错: {str(e)}") from e
+        
+        # 提取JSON数据（去除JSONP包装）
+        data = self._parse_jsonp(content)
+        if not data:
+            return []
+        return data.get("data", [])
 
     def get_valuation_analysis(self, stock_code: str, date_type: int = 3) -> Optional[List[Dict[Any, Any]]]:
         """
@@ -134,11 +118,12 @@ class ValuationDataCrawler(EastMoneyBaseSpider):
                          4 - 10年
         :return: 包含所有估值指标分析数据的列表
         """
-        result_list = []
-        
-        # 遍历所有指标类型获取数据
-        for indicator_type in [self.INDICATOR_TYPE_PE_TTM, self.INDICATOR_TYPE_PB_MRQ, 
-                               self.INDICATOR_TYPE_PS_TTM, self.INDICATOR_TYPE_PC_TTM]:
+        indicator_types = [self.INDICATOR_TYPE_PE_TTM, self.INDICATOR_TYPE_PB_MRQ,
+                           self.INDICATOR_TYPE_PS_TTM, self.INDICATOR_TYPE_PC_TTM]
+        calls = []
+
+        # 先为所有指标类型构造请求
+        for indicator_type in indicator_types:
             # 第一个API调用：获取估值指标当前值
             params1 = {
                 "reportName": "RPT_CUSTOM_DMSK_TREND",
@@ -169,54 +154,48 @@ class ValuationDataCrawler(EastMoneyBaseSpider):
                 "v": "023243304260984377"
             }
             
-            try:
-                # 获取估值指标当前值
-                response1 = self._get_json(self.VALUATION_TREND_URL, params1)
-                # 检查响应是否成功
-                if response1.get("code") != 0 or response1.get("success") is not True or not response1.get("result"):
-                    # 如果不成功，返回错误信息
-                    message = response1.get("message", "未知错误")
-                    return [{"error": message}]
-                
-                data1 = response1["result"]["data"]
-                # 提取最新的估值指标数据（即data[-1]）中的关键字段
-                indicator_data = {}
-                if data1:
-                    latest_data = data1[-1]
-                    indicator_data = {
-                        "SECUCODE": latest_data.get("SECUCODE"),
-                        "TRADE_DATE": latest_data.get("TRADE_DATE"),
-                        "INDICATOR_VALUE": latest_data.get("INDICATOR_VALUE"),
-                        "INDICATOR_TYPE": self.INDICATOR_TYPE_MAP.get(indicator_type, f"未知指标({indicator_type})"),
-                    }
-                
-                # 获取历史分位数数据
-                response2 = self._get_json(self.VALUATION_PERCENTILE_URL, params2)
-                # 检查响应是否成功
-                if response2.get("code") != 0 or response2.get("success") is not True or not response2.get("result"):
-                    # 如果不成功，返回错误信息
-                    message = response2.get("message", "未知错误")
-                    return [{"error": message}]
-                
-                data2 = response2["result"]["data"]
-                # 提取第一条数据的关键字段
-                percentile_data = {}
-                if data2:
-                    first_data = data2[0]
-                    stat_cycle = first_data.get("STATISTICS_CYCLE")
-                    percentile_data = {
-                        "STATISTICS_CYCLE": self.STATISTICS_CYCLE_MAP.get(int(stat_cycle), f"未知周期({stat_cycle})") if stat_cycle else "未知",
-                        "PERCENTILE_THIRTY": first_data.get("PERCENTILE_THIRTY"),
-                        "PERCENTILE_FIFTY": first_data.get("PERCENTILE_FIFTY"),
-                        "PERCENTILE_SEVENTY": first_data.get("PERCENTILE_SEVENTY")
-                    }
-                
-                # 合并两个数据
-                combined_data = {**indicator_data, **percentile_data}
-                result_list.append(combined_data)
-                
-            except Exception as e:
-                return [{"error": str(e)}]
+            # 估值分位数每个交易日收盘后才更新，缓存到下一次刷新
+            ttl = self._daily_cache_ttl()
+            calls.append(lambda p=params1: self._get_json(self.VALUATION_TREND_URL, p, cache_ttl=ttl))
+            calls.append(lambda p=params2: self._get_json(self.VALUATION_PERCENTILE_URL, p, cache_ttl=ttl))
+
+        # 各指标的当前值与历史分位数互不依赖，一次性并发请求
+        responses = self._gather(*calls)
+
+        result_list = []
+        for i, indicator_type in enumerate(indicator_types):
+            response1, response2 = responses[2 * i], responses[2 * i + 1]
+
+            # 检查响应是否成功
+            data1 = self._result_data(response1)
+            # 提取最新的估值指标数据（即data[-1]）中的关键字段
+            indicator_data = {}
+            if data1:
+                latest_data = data1[-1]
+                indicator_data = {
+                    "SECUCODE": latest_data.get("SECUCODE"),
+                    "TRADE_DATE": latest_data.get("TRADE_DATE"),
+                    "INDICATOR_VALUE": latest_data.get("INDICATOR_VALUE"),
+                    "INDICATOR_TYPE": self.INDICATOR_TYPE_MAP.get(indicator_type, f"未知指标({indicator_type})"),
+                }
+            
+            # 检查历史分位数响应是否成功
+            data2 = self._result_data(response2)
+            # 提取第一条数据的关键字段
+            percentile_data = {}
+            if data2:
+                first_data = data2[0]
+                stat_cycle = first_data.get("STATISTICS_CYCLE")
+                percentile_data = {
+                    "STATISTICS_CYCLE": self.STATISTICS_CYCLE_MAP.get(int(stat_cycle), f"未知周期({stat_cycle})") if stat_cycle else "未知",
+                    "PERCENTILE_THIRTY": first_data.get("PERCENTILE_THIRTY"),
+                    "PERCENTILE_FIFTY": first_data.get("PERCENTILE_FIFTY"),
+                    "PERCENTILE_SEVENTY": first_data.get("PERCENTILE_SEVENTY")
+                }
+            
+            # 合并两个数据
+            combined_data = {**indicator_data, **percentile_data}
+            result_list.append(combined_data)
         
         return result_list
 
@@ -241,19 +220,8 @@ class ValuationDataCrawler(EastMoneyBaseSpider):
             "v": "028643453057222734"
         }
         
-        try:
-            response = self._get_json(self.GROWTH_COMPARISON_URL, params)
-            # 检查响应是否成功
-            if response.get("code") != 0 or response.get("success") is not True or not response.get("result"):
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误")
-                return [{"error": message}]
-            
-            data = response["result"]["data"]
-            return data
-            
-        except Exception as e:
-            return [{"error": str(e)}]
+        response = self._get_json(self.GROWTH_COMPARISON_URL, params)
+        return self._result_data(response)
 
     def get_valuation_comparison(self, stock_code: str) -> Optional[List[Dict[Any, Any]]]:
         """
@@ -276,19 +244,8 @@ class ValuationDataCrawler(EastMoneyBaseSpider):
             "v": "06122121234499748"
         }
         
-        try:
-            response = self._get_json(self.VALUATION_COMPARE_URL, params)
-            # 检查响应是否成功
-            if response.get("code") != 0 or response.get("success") is not True or not response.get("result"):
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误")
-                return [{"error": message}]
-            
-            data = response["result"]["data"]
-            return data
-            
-        except Exception as e:
-            return [{"error": str(e)}]
+        response = self._get_json(self.VALUATION_COMPARE_URL, params)
+        return self._result_data(response)
 
     def get_dupont_analysis_comparison(self, stock_code: str) -> Optional[List[Dict[Any, Any]]]:
         """
@@ -311,16 +268,5 @@ class ValuationDataCrawler(EastMoneyBaseSpider):
             "v": "03531384582222341"
         }
         
-        try:
-            response = self._get_json(self.VALUATION_COMPARISON_URL, params)
-            # 检查响应是否成功
-            if response.get("code") != 0 or response.get("success") is not True or not response.get("result"):
-                # 如果不成功，返回错误信息
-                message = response.get("message", "未知错误")
-                return [{"error": message}]
-            
-            data = response["result"]["data"]
-            return data
-            
-        except Exception as e:
-            return [{"error": str(e)}]
+        response = self._get_json(self.VALUATION_COMPARISON_URL, params)
+        return self._result_data(response)
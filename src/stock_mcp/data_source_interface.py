@@ -166,6 +166,26 @@ class FinancialDataInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_fundamental_bundle(self, stock_code: str, include_scope: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        一次性获取报告日期、主营业务范围和最新一期主营构成
+
+        Args:
+            stock_code: 股票代码，包含交易所代码，格式如300059.SZ
+            include_scope: 是否同时获取主营业务范围，为 False 时 business_scope 为 None
+
+        Returns:
+            字典，包含 report_dates、business_scope、main_business 三个字段，
+            各字段格式分别与 get_report_dates、get_business_scope、get_main_business 的返回值一致；
+            另含 main_business_date，为 main_business 实际所属的报告日期（无数据时为 None）
+            如果数据源不支持，返回None
+
+        Raises:
+            DataSourceError: 当数据源出现错误时
+        """
+        pass
+
     @abstractmethod
     def get_business_scope(self, stock_code: str) -> Optional[Dict[Any, Any]]:
         """
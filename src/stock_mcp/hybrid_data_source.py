@@ -92,6 +92,9 @@ class HybridDataSource(FinancialDataInterface):
     def get_report_dates(self, stock_code: str) -> Optional[List[Dict[Any, Any]]]:
         return self.primary.get_report_dates(stock_code)
 
+    def get_fundamental_bundle(self, stock_code: str, include_scope: bool = True) -> Optional[Dict[str, Any]]:
+        return self.primary.get_fundamental_bundle(stock_code, include_scope)
+
     def get_business_scope(self, stock_code: str) -> Optional[Dict[Any, Any]]:
         return self.primary.get_business_scope(stock_code)
 
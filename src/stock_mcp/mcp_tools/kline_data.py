@@ -8,6 +8,7 @@ from typing import List, Dict
 from mcp.server.fastmcp import FastMCP
 from stock_mcp.data_source_interface import FinancialDataInterface
 from stock_mcp.utils.markdown_formatter import format_list_to_markdown_table
+from stock_mcp.utils.tool_errors import handle_tool_errors
 from stock_mcp.utils.utils import format_number, format_large_number
 
 logger = logging.getLogger(__name__)
@@ -201,6 +202,7 @@ def register_kline_tools(app: FastMCP, data_source: FinancialDataInterface):
     """
 
     @app.tool()
+    @handle_tool_errors("获取K线失败")
     def get_kline(
         stock_code: str,
         start_date: str,
@@ -223,64 +225,54 @@ def register_kline_tools(app: FastMCP, data_source: FinancialDataInterface):
             - get_kline("300750.SZ", "2024-01-01", "2024-01-31")
             - get_kline("300750.SZ", "2024-10-01", "2024-10-31", "w")
         """
-        try:
-            logger.info(f"获取K线: {stock_code}, {start_date} 至 {end_date}, 频率: {frequency}")
-
-            # 从数据源获取原始数据
-            raw_klines = data_source.get_historical_k_data(stock_code, start_date, end_date, frequency)
-
-            if not raw_klines:
-                return f"未找到股票代码 '{stock_code}' 在 {start_date} 至 {end_date} 的K线数据"
-
-            # 解析原始数据
-            kline_data = parse_kline_data(raw_klines)
-
-            # 格式化数据
-            formatted_data = []
-            for k in kline_data:
-                open_price = k.get('open', 0)
-                close_price = k.get('close', 0)
-                high_price = k.get('high', 0)
-                low_price = k.get('low', 0)
-                volume = k.get('volume', 0)
-                amount = k.get('amount', 0)
-                change_pct = k.get('change_percent', 0)
-                amplitude = k.get('amplitude', 0)
-                change_amount = k.get('change_amount', 0)
-                turnover_rate = k.get('turnover_rate', 0)
-
-                # 计算 K 线状态
-                if close_price > open_price:
-                    status = "上涨（阳线）"
-                elif close_price < open_price:
-                    status = "下跌（阴线）"
-                else:
-                    status = "平盘（十字星）"
-
-                formatted_data.append({
-                    '日期': k.get('date', ''),
-                    'K线状态': status,
-                    '开盘': format_number(open_price),
-                    '收盘': format_number(close_price),
-                    '最高': format_number(high_price),
-                    '最低': format_number(low_price),
-                    '涨跌幅': f"{'+' if change_pct > 0 else ''}{change_pct:.2f}%",
-                    '成交量': format_large_number(volume),
-                    '成交额': format_large_number(amount),
-                    '振幅': f"{amplitude:.2f}%",
-                    '涨跌额': format_number(change_amount),
-                    '换手率': f"{turnover_rate:.2f}%"
-                })
-
-            table = format_list_to_markdown_table(formatted_data)
-            note = f"\n\n💡 显示 {len(formatted_data)} 条K线数据，频率: {frequency}"
-            return f"## {stock_code} K线数据\n\n{table}{note}"
-
-        except Exception as e:
-            logger.error(f"获取K线时出错: {e}")
-            return f"获取K线失败: {str(e)}"
+        logger.info(f"获取K线: {stock_code}, {start_date} 至 {end_date}, 频率: {frequency}")
+
+        # 从数据源获取原始数据
+        raw_klines = data_source.get_historical_k_data(stock_code, start_date, end_date, frequency)
+
+        if not raw_klines:
+            return f"未找到股票代码 '{stock_code}' 在 {start_date} 至 {end_date} 的K线数据"
+
+        # 解析原始数据
+        kline_data = parse_kline_data(raw_klines)
+
+        # 格式化数据（parse_kline_data 保证各字段齐全且已是数值，直接取值并内联格式化）
+        formatted_data = []
+        append = formatted_data.append
+        for k in kline_data:
+            open_price = k['open']
+            close_price = k['close']
+            change_pct = k['change_percent']
+
+            # 计算 K 线状态
+            if close_price > open_price:
+                status = "上涨（阳线）"
+            elif close_price < open_price:
+                status = "下跌（阴线）"
+            else:
+                status = "平盘（十字星）"
+
+            append({
+                '日期': k['date'],
+                'K线状态': status,
+                '开盘': f"{open_price:,.2f}",
+                '收盘': f"{close_price:,.2f}",
+                '最高': f"{k['high']:,.2f}",
+                '最低': f"{k['low']:,.2f}",
+                '涨跌幅': f"{'+' if change_pct > 0 else ''}{change_pct:.2f}%",
+                '成交量': format_large_number(k['volume']),
+                '成交额': format_large_number(k['amount']),
+                '振幅': f"{k['amplitude']:.2f}%",
+                '涨跌额': f"{k['change_amount']:,.2f}",
+                '换手率': f"{k['turnover_rate']:.2f}%"
+            })
+
+        table = format_list_to_markdown_table(formatted_data)
+        note = f"\n\n💡 显示 {len(formatted_data)} 条K线数据，频率: {frequency}"
+        return f"## {stock_code} K线数据\n\n{table}{note}"
 
     @app.tool()
+    @handle_tool_errors("获取技术指标失败")
     def get_technical_indicators(
         stock_code: str,
         page_size: int = 30
@@ -299,32 +291,28 @@ def register_kline_tools(app: FastMCP, data_source: FinancialDataInterface):
             - get_technical_indicators("300750.SZ")
             - get_technical_indicators("300750.SZ", 20)
         """
-        try:
-            logger.info(f"获取技术指标: {stock_code}, 条数: {page_size}")
+        logger.info(f"获取技术指标: {stock_code}, 条数: {page_size}")
 
-            # 从数据源获取技术指标数据
-            raw_technical_data = data_source.get_technical_indicators(stock_code, page_size)
+        # 从数据源获取技术指标数据
+        raw_technical_data = data_source.get_technical_indicators(stock_code, page_size)
             
-            if not raw_technical_data:
-                return f"未找到股票代码 '{stock_code}' 的技术指标数据"
+        if not raw_technical_data:
+            return f"未找到股票代码 '{stock_code}' 的技术指标数据"
             
-            # 格式化数据
-            formatted_data = format_technical_indicators_data(raw_technical_data)
+        # 格式化数据
+        formatted_data = format_technical_indicators_data(raw_technical_data)
             
-            # 生成Markdown表格
-            table = format_list_to_markdown_table(formatted_data)
-            note = f"\n\n💡 显示 {len(formatted_data)} 条技术指标数据"
+        # 生成Markdown表格
+        table = format_list_to_markdown_table(formatted_data)
+        note = f"\n\n💡 显示 {len(formatted_data)} 条技术指标数据"
             
-            # 添加股票名称
-            stock_name = raw_technical_data[0].get('SECURITY_NAME_ABBR', '') if raw_technical_data else ''
+        # 添加股票名称
+        stock_name = raw_technical_data[0].get('SECURITY_NAME_ABBR', '') if raw_technical_data else ''
             
-            return f"## {stock_name}({stock_code}) 技术指标数据\n\n{table}{note}"
-
-        except Exception as e:
-            logger.error(f"获取技术指标时出错: {e}")
-            return f"获取技术指标失败: {str(e)}"
+        return f"## {stock_name}({stock_code}) 技术指标数据\n\n{table}{note}"
 
     @app.tool()
+    @handle_tool_errors("获取分时图盘口异动失败")
     def get_intraday_changes(
         stock_code: str,
     ) -> str:
@@ -340,21 +328,16 @@ def register_kline_tools(app: FastMCP, data_source: FinancialDataInterface):
         Examples:
             - get_intraday_changes("300750.SZ")
         """
-        try:
-            # 从数据源获取原始数据
-            raw_intraday_changes = data_source.get_intraday_changes(stock_code)
-
-            if not raw_intraday_changes:
-                return f"未找到股票代码 '{stock_code}' 的分时图盘口异动数据"
+        # 从数据源获取原始数据
+        raw_intraday_changes = data_source.get_intraday_changes(stock_code)
 
-            # 格式化数据
-            formatted_data = format_intraday_changes_data(raw_intraday_changes)
+        if not raw_intraday_changes:
+            return f"未找到股票代码 '{stock_code}' 的分时图盘口异动数据"
 
-            # 生成Markdown表格
-            table = format_list_to_markdown_table(formatted_data)
+        # 格式化数据
+        formatted_data = format_intraday_changes_data(raw_intraday_changes)
 
-            return f"## {stock_code}分时图盘口异动数据\n\n{table}"
+        # 生成Markdown表格
+        table = format_list_to_markdown_table(formatted_data)
 
-        except Exception as e:
-            logger.error(f"获取分时图盘口异动时出错: {e}")
-            return f"获取分时图盘口异动失败: {str(e)}"
+        return f"## {stock_code}分时图盘口异动数据\n\n{table}"
@@ -9,6 +9,7 @@ from typing import List, Dict
 from mcp.server.fastmcp import FastMCP
 from stock_mcp.data_source_interface import FinancialDataInterface
 from stock_mcp.utils.markdown_formatter import format_list_to_markdown_table
+from stock_mcp.utils.tool_errors import handle_tool_errors
 from stock_mcp.utils.utils import format_large_number
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,7 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
     """
 
     @app.tool()
+    @handle_tool_errors("执行失败")
     def get_plate_quotation(plate_type: int = 2, page_size: int = 10) -> str:
         """
         获取东方财富网的涨跌幅前N板块行情数据，包括行业板块、概念板块、地域板块等。
@@ -57,32 +59,33 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
             formatted_data = []
 
             for item in raw_data:
-                # 处理价格类数据（需要除以100）
-                latest_price = item.get("f2", 0) / 100 if item.get("f2") else 0
-                change_percent = item.get("f3", 0) / 100 if item.get("f3") else 0
-                change_amount = item.get("f4", 0) / 100 if item.get("f4") else 0
-                turnover_rate = item.get("f8", 0) / 100 if item.get("f8") else 0
-                leading_change_percent = item.get("f136", 0) / 100 if item.get("f136") else 0
-                declining_change_percent = item.get("f222", 0) / 100 if item.get("f222") else 0
+                get = item.get
+                # 处理价格类数据（需要除以100），缺失或为 0 时按 0 处理
+                latest_price = (get("f2") or 0) / 100
+                change_percent = (get("f3") or 0) / 100
+                change_amount = (get("f4") or 0) / 100
+                turnover_rate = (get("f8") or 0) / 100
+                leading_change_percent = (get("f136") or 0) / 100
+                declining_change_percent = (get("f222") or 0) / 100
 
                 # 处理总市值（单位转换为亿）
-                total_market_value = item.get("f20", 0) / 100000000 if item.get("f20") else 0
+                total_market_value = (get("f20") or 0) / 100000000
 
                 formatted_item = {
-                    "板块代码": item.get("f12", ""),
-                    "板块名称": item.get("f14", ""),
+                    "板块代码": get("f12", ""),
+                    "板块名称": get("f14", ""),
                     "最新价": f"{latest_price:.2f}",
                     "涨跌幅": f"{'+' if change_percent > 0 else ''}{change_percent:.2f}%",
                     "涨跌额": f"{'+' if change_amount > 0 else ''}{change_amount:.2f}",
                     "换手率": f"{turnover_rate:.2f}%",
                     "总市值(亿)": f"{total_market_value:.2f}",
-                    "上涨家数": item.get("f104", 0),
-                    "下跌家数": item.get("f105", 0),
-                    "领涨股": f"{item.get('f128', '')}({item.get('f140', '')})",
-                    "领涨股市场": "沪市" if item.get("f141", 0) == 1 else "深市",
+                    "上涨家数": get("f104", 0),
+                    "下跌家数": get("f105", 0),
+                    "领涨股": f"{get('f128', '')}({get('f140', '')})",
+                    "领涨股市场": "沪市" if get("f141", 0) == 1 else "深市",
                     "领涨股涨跌幅": f"{'+' if leading_change_percent > 0 else ''}{leading_change_percent:.2f}%",
-                    "领跌股": f"{item.get('f207', '')}({item.get('f208', '')})",
-                    "领跌股市场": "沪市" if item.get("f209", 0) == 1 else "深市",
+                    "领跌股": f"{get('f207', '')}({get('f208', '')})",
+                    "领跌股市场": "沪市" if get("f209", 0) == 1 else "深市",
                     "领跌股涨跌幅": f"{'+' if declining_change_percent > 0 else ''}{declining_change_percent:.2f}%"
                 }
 
@@ -90,33 +93,29 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
 
             return formatted_data
 
-        try:
-            logger.info(f"获取板块行情数据: 板块类型={plate_type}")
+        logger.info(f"获取板块行情数据: 板块类型={plate_type}")
             
-            # 获取原始数据
-            raw_data = data_source.get_plate_quotation(plate_type, page_size)
+        # 获取原始数据
+        raw_data = data_source.get_plate_quotation(plate_type, page_size)
             
-            if not raw_data:
-                return "未找到板块行情数据"
+        if not raw_data:
+            return "未找到板块行情数据"
             
-            # 格式化数据
-            formatted_data = _format_plate_data(raw_data)
+        # 格式化数据
+        formatted_data = _format_plate_data(raw_data)
             
-            # 转换为Markdown表格
-            table = format_list_to_markdown_table(formatted_data)
+        # 转换为Markdown表格
+        table = format_list_to_markdown_table(formatted_data)
             
-            # 添加说明
-            plate_type_map = {1: "地域板块", 2: "行业板块", 3: "概念板块"}
-            plate_name = plate_type_map.get(plate_type, "未知板块")
-            note = f"\n\n💡 显示涨跌幅前{page_size}{plate_name}的行情数据"
+        # 添加说明
+        plate_type_map = {1: "地域板块", 2: "行业板块", 3: "概念板块"}
+        plate_name = plate_type_map.get(plate_type, "未知板块")
+        note = f"\n\n💡 显示涨跌幅前{page_size}{plate_name}的行情数据"
             
-            return f"## {plate_name}涨跌幅前{page_size}行情数据\n\n{table}{note}"
-
-        except Exception as e:
-            logger.error(f"工具执行出错: {e}")
-            return f"执行失败: {str(e)}"
+        return f"## {plate_name}涨跌幅前{page_size}行情数据\n\n{table}{note}"
 
     @app.tool()
+    @handle_tool_errors("执行失败")
     def get_historical_fund_flow(stock_code: str, limit: int = 10) -> str:
         """
         获取指定股票最近N个交易日的资金流向数据，包括主力资金、散户资金、中单资金等的流入流出情况。
@@ -148,70 +147,63 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
             
             klines = raw_data.get("klines", [])
             
+            fmt_large = format_large_number
             # 反向遍历，使最新的数据显示在前面
             for line in reversed(klines):
                 parts = line.split(",")
                 
-                # 解析各个字段
+                # 解析各个字段：日期之后依次为
+                # 主力/小单/中单/大单/超大单净流入_净额，主力/小单/中单/大单/超大单净流入_净占比，收盘价，涨跌幅
                 date = parts[0]
-                main_net_inflow_amount = round(float(parts[1]), 2)  # 主力净流入_净额
-                retail_net_inflow_amount = round(float(parts[2]), 2)  # 小单净流入_净额
-                medium_net_inflow_amount = round(float(parts[3]), 2)  # 中单净流入_净额
-                large_net_inflow_amount = round(float(parts[4]), 2)  # 大单净流入_净额
-                super_large_net_inflow_amount = round(float(parts[5]), 2)  # 超大单净流入_净额
-                main_net_inflow_ratio = round(float(parts[6]), 2)  # 主力净流入_净占比
-                retail_net_inflow_ratio = round(float(parts[7]), 2)  # 小单净流入_净占比
-                medium_net_inflow_ratio = round(float(parts[8]), 2)  # 中单净流入_净占比
-                large_net_inflow_ratio = round(float(parts[9]), 2)  # 大单净流入_净占比
-                super_large_net_inflow_ratio = round(float(parts[10]), 2)  # 超大单净流入_净占比
-                closing_price = round(float(parts[11]), 2)  # 收盘价
-                change_percent = round(float(parts[12]), 2)  # 涨跌幅
-                
+                (
+                    main_net_inflow_amount, retail_net_inflow_amount, medium_net_inflow_amount,
+                    large_net_inflow_amount, super_large_net_inflow_amount,
+                    main_net_inflow_ratio, retail_net_inflow_ratio, medium_net_inflow_ratio,
+                    large_net_inflow_ratio, super_large_net_inflow_ratio,
+                    closing_price, change_percent,
+                ) = [round(float(value), 2) for value in parts[1:13]]
+
                 formatted_item = {
                     "日期": date,
                     "收盘价": closing_price,
-                    "涨跌幅": f"{'+' if change_percent >= 0 else ''}{change_percent}%",
-                    "主力净流入_净额": format_large_number(main_net_inflow_amount),
-                    "主力净流入_净占比": f"{'+' if main_net_inflow_ratio >= 0 else ''}{main_net_inflow_ratio}%",
-                    "超大单净流入_净额": format_large_number(super_large_net_inflow_amount),
-                    "超大单净流入_净占比": f"{'+' if super_large_net_inflow_ratio >= 0 else ''}{super_large_net_inflow_ratio}%",
-                    "大单净流入_净额": format_large_number(large_net_inflow_amount),
-                    "大单净流入_净占比": f"{'+' if large_net_inflow_ratio >= 0 else ''}{large_net_inflow_ratio}%",
-                    "中单净流入_净额": format_large_number(medium_net_inflow_amount),
-                    "中单净流入_净占比": f"{'+' if medium_net_inflow_ratio >= 0 else ''}{medium_net_inflow_ratio}%",
-                    "小单净流入_净额": format_large_number(retail_net_inflow_amount),
-                    "小单净流入_净占比": f"{'+' if retail_net_inflow_ratio >= 0 else ''}{retail_net_inflow_ratio}%"
+                    "涨跌幅": f"{change_percent:+}%",
+                    "主力净流入_净额": fmt_large(main_net_inflow_amount),
+                    "主力净流入_净占比": f"{main_net_inflow_ratio:+}%",
+                    "超大单净流入_净额": fmt_large(super_large_net_inflow_amount),
+                    "超大单净流入_净占比": f"{super_large_net_inflow_ratio:+}%",
+                    "大单净流入_净额": fmt_large(large_net_inflow_amount),
+                    "大单净流入_净占比": f"{large_net_inflow_ratio:+}%",
+                    "中单净流入_净额": fmt_large(medium_net_inflow_amount),
+                    "中单净流入_净占比": f"{medium_net_inflow_ratio:+}%",
+                    "小单净流入_净额": fmt_large(retail_net_inflow_amount),
+                    "小单净流入_净占比": f"{retail_net_inflow_ratio:+}%"
                 }
                 
                 formatted_data.append(formatted_item)
             
             return formatted_data
 
-        try:
-            logger.info(f"获取历史资金流向数据: stock_code={stock_code}")
+        logger.info(f"获取历史资金流向数据: stock_code={stock_code}")
             
-            # 通过数据源获取数据
-            fund_flow_data = data_source.get_historical_fund_flow(stock_code, limit)
+        # 通过数据源获取数据
+        fund_flow_data = data_source.get_historical_fund_flow(stock_code, limit)
             
-            if not fund_flow_data:
-                return "未找到历史资金流向数据"
+        if not fund_flow_data:
+            return "未找到历史资金流向数据"
             
-            # 格式化数据
-            formatted_data = _format_fund_flow_data(fund_flow_data)
+        # 格式化数据
+        formatted_data = _format_fund_flow_data(fund_flow_data)
             
-            # 转换为Markdown表格
-            table = format_list_to_markdown_table(formatted_data)
+        # 转换为Markdown表格
+        table = format_list_to_markdown_table(formatted_data)
             
-            # 获取名称
-            index_name = fund_flow_data.get("name", "未知")
+        # 获取名称
+        index_name = fund_flow_data.get("name", "未知")
             
-            return f"## {index_name}历史资金流向数据\n\n{table}\n\n💡 显示最近{limit}个交易日的资金流向数据，按日期倒序排列"
-
-        except Exception as e:
-            logger.error(f"工具执行出错: {e}")
-            return f"执行失败: {str(e)}"
+        return f"## {index_name}历史资金流向数据\n\n{table}\n\n💡 显示最近{limit}个交易日的资金流向数据，按日期倒序排列"
 
     @app.tool()
+    @handle_tool_errors("获取龙虎榜数据失败")
     def get_billboard_data(trade_date: str, page_size: int = 10) -> str:
         """
         获取指定交易日的龙虎榜数据，包括股票基本信息、行情数据、资金流向等。
@@ -239,48 +231,50 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
             """
             formatted_data = []
             
+            fmt_large = format_large_number
             for item in raw_data:
+                get = item.get
                 # 处理基础信息
-                security_code = item.get("SECURITY_CODE", "")
-                security_name = item.get("SECURITY_NAME_ABBR", "")
+                security_code = get("SECURITY_CODE", "")
+                security_name = get("SECURITY_NAME_ABBR", "")
                 
                 # 处理行情数据
-                close_price = item.get("CLOSE_PRICE", 0)
-                change_rate = item.get("CHANGE_RATE", 0)
-                turnover_rate = item.get("TURNOVERRATE", 0)
+                close_price = get("CLOSE_PRICE", 0)
+                change_rate = get("CHANGE_RATE", 0)
+                turnover_rate = get("TURNOVERRATE", 0)
                 
                 # 处理资金数据 (单位转换)
                 # 龙虎榜资金数据单位为元，需要转换为万元显示
-                billboard_net_amt = item.get("BILLBOARD_NET_AMT", 0)  # 净买额
-                billboard_buy_amt = item.get("BILLBOARD_BUY_AMT", 0)  # 买入额
-                billboard_sell_amt = item.get("BILLBOARD_SELL_AMT", 0)  # 卖出额
-                billboard_deal_amt = item.get("BILLBOARD_DEAL_AMT", 0)  # 成交额
-                accum_amount = item.get("ACCUM_AMOUNT", 0)  # 市场总成交额
+                billboard_net_amt = get("BILLBOARD_NET_AMT", 0)  # 净买额
+                billboard_buy_amt = get("BILLBOARD_BUY_AMT", 0)  # 买入额
+                billboard_sell_amt = get("BILLBOARD_SELL_AMT", 0)  # 卖出额
+                billboard_deal_amt = get("BILLBOARD_DEAL_AMT", 0)  # 成交额
+                accum_amount = get("ACCUM_AMOUNT", 0)  # 市场总成交额
                 
                 # 流通市值 (单位转换为亿元)
-                free_market_cap = item.get("FREE_MARKET_CAP", 0)  # 流通市值(元)
+                free_market_cap = get("FREE_MARKET_CAP", 0)  # 流通市值(元)
                 
                 # 处理占比数据
-                deal_net_ratio = item.get("DEAL_NET_RATIO", 0)  # 净买额占总成交比
-                deal_amount_ratio = item.get("DEAL_AMOUNT_RATIO", 0)  # 成交额占总成交比
+                deal_net_ratio = get("DEAL_NET_RATIO", 0)  # 净买额占总成交比
+                deal_amount_ratio = get("DEAL_AMOUNT_RATIO", 0)  # 成交额占总成交比
                 
                 # 解读说明
-                explain = item.get("EXPLAIN", "")
-                explanation = item.get("EXPLANATION", "")  # 上榜原因
+                explain = get("EXPLAIN", "")
+                explanation = get("EXPLANATION", "")  # 上榜原因
                 
                 formatted_item = {
                     "证券代码": security_code,
                     "名称": security_name,
                     "收盘价": f"{close_price:.2f}元" if close_price else "N/A",
-                    "涨跌幅": f"{'+' if change_rate >= 0 else ''}{change_rate:.2f}%" if change_rate is not None else "N/A",
+                    "涨跌幅": f"{change_rate:+.2f}%" if change_rate is not None else "N/A",
                     "换手率": f"{turnover_rate:.2f}%" if turnover_rate is not None else "N/A",
-                    "流通市值": format_large_number(free_market_cap) if free_market_cap else "N/A",
-                    "龙虎榜净买额": format_large_number(billboard_net_amt) + "元" if billboard_net_amt else "N/A",
-                    "龙虎榜买入额": format_large_number(billboard_buy_amt) + "元" if billboard_buy_amt else "N/A",
-                    "龙虎榜卖出额": format_large_number(billboard_sell_amt) + "元" if billboard_sell_amt else "N/A",
-                    "龙虎榜成交额": format_large_number(billboard_deal_amt) + "元" if billboard_deal_amt else "N/A",
-                    "市场总成交额": format_large_number(accum_amount) + "元" if accum_amount else "N/A",
-                    "净买额占总成交比": f"{'+' if deal_net_ratio >= 0 else ''}{deal_net_ratio:.2f}%" if deal_net_ratio is not None else "N/A",
+                    "流通市值": fmt_large(free_market_cap) if free_market_cap else "N/A",
+                    "龙虎榜净买额": fmt_large(billboard_net_amt) + "元" if billboard_net_amt else "N/A",
+                    "龙虎榜买入额": fmt_large(billboard_buy_amt) + "元" if billboard_buy_amt else "N/A",
+                    "龙虎榜卖出额": fmt_large(billboard_sell_amt) + "元" if billboard_sell_amt else "N/A",
+                    "龙虎榜成交额": fmt_large(billboard_deal_amt) + "元" if billboard_deal_amt else "N/A",
+                    "市场总成交额": fmt_large(accum_amount) + "元" if accum_amount else "N/A",
+                    "净买额占总成交比": f"{deal_net_ratio:+.2f}%" if deal_net_ratio is not None else "N/A",
                     "成交额占总成交比": f"{deal_amount_ratio:.2f}%" if deal_amount_ratio is not None else "N/A",
                     "上榜原因": explanation,
                     "解读": explain
@@ -290,35 +284,27 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
             
             return formatted_data
 
-        try:
-            logger.info(f"获取龙虎榜数据: trade_date={trade_date}")
-            
-            # 获取原始数据
-            raw_data = data_source.get_billboard_data(trade_date, page_size)
+        logger.info(f"获取龙虎榜数据: trade_date={trade_date}")
             
-            # 检查是否有错误信息
-            if raw_data and "error" in raw_data[0]:
-                return f"获取龙虎榜数据失败: {raw_data[0]['error']}"
+        # 获取原始数据
+        raw_data = data_source.get_billboard_data(trade_date, page_size)
             
-            if not raw_data:
-                return "未找到龙虎榜数据"
+        if not raw_data:
+            return "未找到龙虎榜数据"
             
-            # 格式化数据
-            formatted_data = _format_billboard_data(raw_data)
+        # 格式化数据
+        formatted_data = _format_billboard_data(raw_data)
             
-            # 转换为Markdown表格
-            table = format_list_to_markdown_table(formatted_data)
+        # 转换为Markdown表格
+        table = format_list_to_markdown_table(formatted_data)
             
-            # 添加说明
-            note = f"\n\n💡 显示涨幅前{page_size}的龙虎榜股票，交易日期: {trade_date}，共{len(raw_data)}条数据"
+        # 添加说明
+        note = f"\n\n💡 显示涨幅前{page_size}的龙虎榜股票，交易日期: {trade_date}，共{len(raw_data)}条数据"
             
-            return f"## 涨幅前{page_size}的龙虎榜数据\n\n{table}{note}"
-
-        except Exception as e:
-            logger.error(f"工具执行出错: {e}")
-            return f"执行失败: {str(e)}"
+        return f"## 涨幅前{page_size}的龙虎榜数据\n\n{table}{note}"
 
     @app.tool()
+    @handle_tool_errors("获取龙虎榜上榜历史记录失败")
     def get_stock_billboard_data(stock_code: str, page_size: int = 10) -> str:
         """
         获取龙虎榜上榜历史数据（历次上榜）
@@ -377,15 +363,15 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
                 formatted_item = {
                     "日期": trade_date,
                     "收盘价": f"{close_price:.2f}元" if close_price else "N/A",
-                    "涨跌幅": f"{'+' if change_rate >= 0 else ''}{change_rate:.2f}%",
+                    "涨跌幅": f"{change_rate:+.2f}%",
                     "上榜原因": explain,
-                    "后1日涨跌幅": f"{'+' if d1_change >= 0 else ''}{d1_change:.2f}%",
-                    "后2日涨跌幅": f"{'+' if d2_change >= 0 else ''}{d2_change:.2f}%",
-                    "后3日涨跌幅": f"{'+' if d3_change >= 0 else ''}{d3_change:.2f}%",
-                    "后5日涨跌幅": f"{'+' if d5_change >= 0 else ''}{d5_change:.2f}%",
-                    "后10日涨跌幅": f"{'+' if d10_change >= 0 else ''}{d10_change:.2f}%",
-                    "后20日涨跌幅": f"{'+' if d20_change >= 0 else ''}{d20_change:.2f}%",
-                    "后30日涨跌幅": f"{'+' if d30_change >= 0 else ''}{d30_change:.2f}%",
+                    "后1日涨跌幅": f"{d1_change:+.2f}%",
+                    "后2日涨跌幅": f"{d2_change:+.2f}%",
+                    "后3日涨跌幅": f"{d3_change:+.2f}%",
+                    "后5日涨跌幅": f"{d5_change:+.2f}%",
+                    "后10日涨跌幅": f"{d10_change:+.2f}%",
+                    "后20日涨跌幅": f"{d20_change:+.2f}%",
+                    "后30日涨跌幅": f"{d30_change:+.2f}%",
                     "营业部买入金额": format_large_number(net_buy_amt) + "元" if net_buy_amt else "N/A",
                     "营业部卖出金额": format_large_number(net_sell_amt) + "元" if net_sell_amt else "N/A",
                     "营业部实际净买额": format_large_number(net_operatedept_amt) + "元" if net_operatedept_amt else "N/A"
@@ -395,40 +381,32 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
             
             return formatted_data
 
-        try:
-            logger.info(f"获取龙虎榜历史数据: stock_code={stock_code}")
+        logger.info(f"获取龙虎榜历史数据: stock_code={stock_code}")
 
-            # 获取原始数据
-            raw_data = data_source.get_stock_billboard_data(stock_code, page_size)
-            
-            # 检查是否有错误信息
-            if raw_data and "error" in raw_data[0]:
-                return f"获取龙虎榜上榜历史记录失败: {raw_data[0]['error']}"
+        # 获取原始数据
+        raw_data = data_source.get_stock_billboard_data(stock_code, page_size)
             
-            if not raw_data:
-                return "未找到龙虎榜上榜历史记录"
+        if not raw_data:
+            return "未找到龙虎榜上榜历史记录"
             
-            # 格式化数据
-            formatted_data = _format_stock_billboard_data(raw_data)
+        # 格式化数据
+        formatted_data = _format_stock_billboard_data(raw_data)
             
-            # 转换为Markdown表格
-            table = format_list_to_markdown_table(formatted_data)
+        # 转换为Markdown表格
+        table = format_list_to_markdown_table(formatted_data)
             
-            # 获取股票名称
-            stock_name = ""
-            if raw_data and isinstance(raw_data, list) and len(raw_data) > 0:
-                stock_name = raw_data[0].get("SECURITY_NAME_ABBR", "")
+        # 获取股票名称
+        stock_name = ""
+        if raw_data and isinstance(raw_data, list) and len(raw_data) > 0:
+            stock_name = raw_data[0].get("SECURITY_NAME_ABBR", "")
             
-            # 添加说明
-            note = f"\n\n💡 显示{stock_name}({stock_code})历史龙虎榜上榜记录，共{len(formatted_data)}条记录"
+        # 添加说明
+        note = f"\n\n💡 显示{stock_name}({stock_code})历史龙虎榜上榜记录，共{len(formatted_data)}条记录"
             
-            return f"## {stock_name}({stock_code})历史龙虎榜上榜记录\n\n{table}{note}"
-
-        except Exception as e:
-            logger.error(f"工具执行出错: {e}")
-            return f"执行失败: {str(e)}"
+        return f"## {stock_name}({stock_code})历史龙虎榜上榜记录\n\n{table}{note}"
 
     @app.tool()
+    @handle_tool_errors("获取市场表现数据失败")
     def get_market_performance(secucode: str) -> str:
         """
         获取股票市场表现数据，包括与大盘和行业板块的涨跌对比
@@ -516,33 +494,29 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
                 
             return formatted_list
 
-        try:
-            logger.info(f"获取市场表现数据: secucode={secucode}")
+        logger.info(f"获取市场表现数据: secucode={secucode}")
             
-            # 获取原始数据
-            raw_data = data_source.get_market_performance(secucode)
+        # 获取原始数据
+        raw_data = data_source.get_market_performance(secucode)
             
-            if not raw_data:
-                return "未找到市场表现数据"
+        if not raw_data:
+            return "未找到市场表现数据"
             
-            # 格式化数据
-            formatted_data = _format_market_performance_data(raw_data)
+        # 格式化数据
+        formatted_data = _format_market_performance_data(raw_data)
             
-            # 转换为Markdown表格
-            table = format_list_to_markdown_table(formatted_data)
+        # 转换为Markdown表格
+        table = format_list_to_markdown_table(formatted_data)
             
-            # 获取股票名称
-            stock_name = ""
-            if raw_data and isinstance(raw_data, list) and len(raw_data) > 0:
-                stock_name = raw_data[0].get("SECURITY_NAME_ABBR", "")
+        # 获取股票名称
+        stock_name = ""
+        if raw_data and isinstance(raw_data, list) and len(raw_data) > 0:
+            stock_name = raw_data[0].get("SECURITY_NAME_ABBR", "")
             
-            return f"## {stock_name}({secucode})市场表现数据\n\n{table}\n\n💡 显示{stock_name}与沪深300指数及所属行业板块的涨跌对比"
-
-        except Exception as e:
-            logger.error(f"工具执行出错: {e}")
-            return f"执行失败: {str(e)}"
+        return f"## {stock_name}({secucode})市场表现数据\n\n{table}\n\n💡 显示{stock_name}与沪深300指数及所属行业板块的涨跌对比"
 
     @app.tool()
+    @handle_tool_errors("执行失败")
     def get_plate_fund_flow(plate_type: int = 2, page_size: int = 10) -> str:
         """
         获取板块资金流今日排行，包括行业板块、概念板块、地域板块等的资金流入流出情况。
@@ -576,47 +550,48 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
             formatted_data = []
 
             for item in raw_data:
+                get = item.get
                 # 基本信息
-                plate_code = item.get("f12", "")
-                plate_name = item.get("f14", "")
+                plate_code = get("f12", "")
+                plate_name = get("f14", "")
                 
                 # 价格信息
-                current_price = item.get("f2", 0)  if item.get("f2") else 0
-                change_percent = item.get("f3", 0) if item.get("f3") else 0
+                current_price = get("f2") or 0
+                change_percent = get("f3") or 0
                 
                 # 资金流信息
-                main_net_inflow = item.get("f62", 0)  # 主力净流入
-                super_large_net_inflow = item.get("f66", 0)  # 超大单净流入
-                large_net_inflow = item.get("f72", 0)  # 大单净流入
-                medium_net_inflow = item.get("f78", 0)  # 中单净流入
-                small_net_inflow = item.get("f84", 0)  # 小单净流入
+                main_net_inflow = get("f62", 0)  # 主力净流入
+                super_large_net_inflow = get("f66", 0)  # 超大单净流入
+                large_net_inflow = get("f72", 0)  # 大单净流入
+                medium_net_inflow = get("f78", 0)  # 中单净流入
+                small_net_inflow = get("f84", 0)  # 小单净流入
                 
                 # 资金流占比
-                main_net_inflow_ratio = item.get("f184", 0) if item.get("f184") else 0  # 主力净流入占比
-                super_large_ratio = item.get("f69", 0) if item.get("f69") else 0  # 超大单净流入占比
-                large_ratio = item.get("f75", 0) if item.get("f75") else 0  # 大单净流入占比
-                medium_ratio = item.get("f81", 0) if item.get("f81") else 0  # 中单净流入占比
-                small_ratio = item.get("f87", 0) if item.get("f87") else 0  # 小单净流入占比
+                main_net_inflow_ratio = get("f184") or 0  # 主力净流入占比
+                super_large_ratio = get("f69") or 0  # 超大单净流入占比
+                large_ratio = get("f75") or 0  # 大单净流入占比
+                medium_ratio = get("f81") or 0  # 中单净流入占比
+                small_ratio = get("f87") or 0  # 小单净流入占比
                 
                 # 领涨股信息
-                leading_stock_name = item.get("f204", "")
-                leading_stock_code = item.get("f205", "")
+                leading_stock_name = get("f204", "")
+                leading_stock_code = get("f205", "")
                 
                 formatted_item = {
                     "板块代码": plate_code,
                     "板块名称": plate_name,
                     "当前价格": f"{current_price:.2f}",
-                    "涨跌幅": f"{'+' if change_percent >= 0 else ''}{change_percent:.2f}%",
+                    "涨跌幅": f"{change_percent:+.2f}%",
                     "主力净流入": format_large_number(main_net_inflow),
-                    "主力净流入占比": f"{'+' if main_net_inflow_ratio >= 0 else ''}{main_net_inflow_ratio:.2f}%",
+                    "主力净流入占比": f"{main_net_inflow_ratio:+.2f}%",
                     "超大单净流入": format_large_number(super_large_net_inflow),
-                    "超大单净流入占比": f"{'+' if super_large_ratio >= 0 else ''}{super_large_ratio:.2f}%",
+                    "超大单净流入占比": f"{super_large_ratio:+.2f}%",
                     "大单净流入": format_large_number(large_net_inflow),
-                    "大单净流入占比": f"{'+' if large_ratio >= 0 else ''}{large_ratio:.2f}%",
+                    "大单净流入占比": f"{large_ratio:+.2f}%",
                     "中单净流入": format_large_number(medium_net_inflow),
-                    "中单净流入占比": f"{'+' if medium_ratio >= 0 else ''}{medium_ratio:.2f}%",
+                    "中单净流入占比": f"{medium_ratio:+.2f}%",
                     "小单净流入": format_large_number(small_net_inflow),
-                    "小单净流入占比": f"{'+' if small_ratio >= 0 else ''}{small_ratio:.2f}%",
+                    "小单净流入占比": f"{small_ratio:+.2f}%",
                     "领涨股": f"{leading_stock_name}({leading_stock_code})"
                 }
 
@@ -624,33 +599,29 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
 
             return formatted_data
 
-        try:
-            logger.info(f"获取板块资金流数据: 板块类型={plate_type}")
+        logger.info(f"获取板块资金流数据: 板块类型={plate_type}")
             
-            # 获取原始数据
-            raw_data = data_source.get_plate_fund_flow(plate_type, page_size)
+        # 获取原始数据
+        raw_data = data_source.get_plate_fund_flow(plate_type, page_size)
             
-            if not raw_data:
-                return "未找到板块资金流数据"
+        if not raw_data:
+            return "未找到板块资金流数据"
             
-            # 格式化数据
-            formatted_data = _format_plate_fund_flow_data(raw_data)
+        # 格式化数据
+        formatted_data = _format_plate_fund_flow_data(raw_data)
             
-            # 转换为Markdown表格
-            table = format_list_to_markdown_table(formatted_data)
+        # 转换为Markdown表格
+        table = format_list_to_markdown_table(formatted_data)
             
-            # 添加说明
-            plate_type_map = {1: "地域板块", 2: "行业板块", 3: "概念板块"}
-            plate_name = plate_type_map.get(plate_type, "未知板块")
-            note = f"\n\n💡 显示{plate_name}资金流数据，按主力净流入排序，共{len(formatted_data)}条数据"
+        # 添加说明
+        plate_type_map = {1: "地域板块", 2: "行业板块", 3: "概念板块"}
+        plate_name = plate_type_map.get(plate_type, "未知板块")
+        note = f"\n\n💡 显示{plate_name}资金流数据，按主力净流入排序，共{len(formatted_data)}条数据"
             
-            return f"## {plate_name}资金流数据\n\n{table}{note}"
-
-        except Exception as e:
-            logger.error(f"工具执行出错: {e}")
-            return f"执行失败: {str(e)}"
+        return f"## {plate_name}资金流数据\n\n{table}{note}"
 
     @app.tool()
+    @handle_tool_errors("执行失败")
     def get_current_plate_changes(page_size: int = 10) -> str:
         """
         获取当日板块异动数据，包括各板块的涨跌幅、主力资金流向以及板块内异动个股等信息（异动总次数降序）。
@@ -768,28 +739,24 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
 
             return formatted_data
 
-        try:
-            logger.info(f"获取当日板块异动数据")
+        logger.info(f"获取当日板块异动数据")
             
-            # 获取原始数据
-            raw_data = data_source.get_current_plate_changes(page_size)
+        # 获取原始数据
+        raw_data = data_source.get_current_plate_changes(page_size)
             
-            if not raw_data:
-                return "未找到当日板块异动数据"
+        if not raw_data:
+            return "未找到当日板块异动数据"
             
-            # 格式化数据
-            formatted_data = _format_plate_changes_data(raw_data)
+        # 格式化数据
+        formatted_data = _format_plate_changes_data(raw_data)
             
-            # 转换为Markdown表格
-            table = format_list_to_markdown_table(formatted_data)
+        # 转换为Markdown表格
+        table = format_list_to_markdown_table(formatted_data)
             
-            return f"## 当日板块异动数据\n\n{table}\n\n💡 显示最近的{len(formatted_data)}个板块异动情况"
-
-        except Exception as e:
-            logger.error(f"工具执行出错: {e}")
-            return f"执行失败: {str(e)}"
+        return f"## 当日板块异动数据\n\n{table}\n\n💡 显示最近的{len(formatted_data)}个板块异动情况"
 
     @app.tool()
+    @handle_tool_errors("执行失败")
     def get_current_count_changes() -> str:
         """
         获取当日异动对数据对比情况
@@ -864,28 +831,24 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
 
             return formatted_data
 
-        try:
-            logger.info("获取当日异动对数据对比情况")
+        logger.info("获取当日异动对数据对比情况")
             
-            # 获取原始数据
-            raw_data = data_source.get_current_count_changes()
+        # 获取原始数据
+        raw_data = data_source.get_current_count_changes()
             
-            if not raw_data:
-                return "未找到当日异动对数据"
+        if not raw_data:
+            return "未找到当日异动对数据"
             
-            # 格式化数据
-            formatted_data = _format_count_changes_data(raw_data)
+        # 格式化数据
+        formatted_data = _format_count_changes_data(raw_data)
             
-            # 转换为Markdown表格
-            table = format_list_to_markdown_table(formatted_data)
+        # 转换为Markdown表格
+        table = format_list_to_markdown_table(formatted_data)
             
-            return f"## 当日异动对数据对比情况\n\n{table}\n\n💡 显示当天截止当前时间出现异动的股票家数统计，相同股票同一类型重复出现记为一次"
-
-        except Exception as e:
-            logger.error(f"工具执行出错: {e}")
-            return f"执行失败: {str(e)}"
+        return f"## 当日异动对数据对比情况\n\n{table}\n\n💡 显示当天截止当前时间出现异动的股票家数统计，相同股票同一类型重复出现记为一次"
 
     @app.tool()
+    @handle_tool_errors("执行失败")
     def get_macroeconomic_research(begin_time: str, 
                                  end_time: str) -> str:
         """
@@ -936,25 +899,20 @@ def register_market_tools(app: FastMCP, data_source: FinancialDataInterface):
 
             return formatted_data
 
-        try:
-            logger.info("获取宏观研究报告数据")
+        logger.info("获取宏观研究报告数据")
             
-            # 获取原始数据
-            raw_data = data_source.get_macroeconomic_research(begin_time, end_time)
+        # 获取原始数据
+        raw_data = data_source.get_macroeconomic_research(begin_time, end_time)
             
-            if not raw_data:
-                return "未找到宏观研究报告数据"
+        if not raw_data:
+            return "未找到宏观研究报告数据"
             
-            # 格式化数据
-            formatted_data = _format_macroeconomic_research_data(raw_data)
+        # 格式化数据
+        formatted_data = _format_macroeconomic_research_data(raw_data)
             
-            # 转换为Markdown表格
-            table = format_list_to_markdown_table(formatted_data)
+        # 转换为Markdown表格
+        table = format_list_to_markdown_table(formatted_data)
             
-            return f"## 宏观研究报告数据\n\n{table}\n\n💡 显示最近的宏观研究报告，时间范围从{begin_time}到{end_time}"
-
-        except Exception as e:
-            logger.error(f"工具执行出错: {e}")
-            return f"执行失败: {str(e)}"
+        return f"## 宏观研究报告数据\n\n{table}\n\n💡 显示最近的宏观研究报告，时间范围从{begin_time}到{end_time}"
 
     logger.info("市场板块行情工具已注册")
\ No newline at end of file
@@ -44,15 +44,19 @@ class WebCrawlerDataSource(FinancialDataInterface):
             from stock_mcp.crawler.financial_analysis import FinancialAnalysisCrawler
             from stock_mcp.crawler.market import MarketSpider
             from stock_mcp.crawler.smart_review import SmartReviewCrawler
+            from stock_mcp.crawler.base_crawler import get_shared_session, preconnect
 
-            self.kline_spider = KlineSpider()
-            self.searcher = StockSearcher()
-            self.real_time_spider = RealTimeDataSpider()
-            self.fundamental_crawler = FundamentalDataCrawler()
-            self.valuation_crawler = ValuationDataCrawler()
-            self.financial_analysis_crawler = FinancialAnalysisCrawler()
-            self.market_spider = MarketSpider()
-            self.smart_review_crawler = SmartReviewCrawler()
+            # 所有爬虫共用同一个连接池
+            session = get_shared_session()
+
+            self.kline_spider = KlineSpider(session=session)
+            self.searcher = StockSearcher(session=session)
+            self.real_time_spider = RealTimeDataSpider(session=session)
+            self.fundamental_crawler = FundamentalDataCrawler(session=session)
+            self.valuation_crawler = ValuationDataCrawler(session=session)
+            self.financial_analysis_crawler = FinancialAnalysisCrawler(session=session)
+            self.market_spider = MarketSpider(session=session)
+            self.smart_review_crawler = SmartReviewCrawler(session=session)
 
             # 验证关键组件是否初始化成功
             if not all([self.kline_spider, self.searcher, self.real_time_spider,
@@ -61,6 +65,9 @@ class WebCrawlerDataSource(FinancialDataInterface):
                        self.smart_review_crawler]):
                 raise RuntimeError("一个或多个爬虫组件初始化失败")
 
+            # 后台预热到各数据接口主机的连接
+            preconnect()
+
             return True
         except ImportError as e:
             raise ImportError(f"无法导入必要的爬虫模块: {e}") from e
@@ -68,6 +75,10 @@ class WebCrawlerDataSource(FinancialDataInterface):
             raise Exception(f"初始化爬虫组件失败: {e}") from e
 
     def cleanup(self):
+        from stock_mcp.crawler.base_crawler import close_shared_session
+
+        # 释放共享连接池中的 keep-alive 连接
+        close_shared_session()
         self.kline_spider = None
         self.searcher = None
         self.real_time_spider = None
@@ -129,6 +140,9 @@ class WebCrawlerDataSource(FinancialDataInterface):
     def get_report_dates(self, stock_code: str) -> Optional[List[Dict[Any, Any]]]:
         return self.fundamental_crawler.get_report_dates(stock_code)
 
+    def get_fundamental_bundle(self, stock_code: str, include_scope: bool = True) -> Optional[Dict[str, Any]]:
+        return self.fundamental_crawler.get_fundamental_bundle(stock_code, include_scope)
+
     def get_business_scope(self, stock_code: str) -> Optional[Dict[Any, Any]]:
         return self.fundamental_crawler.get_business_scope(stock_code)
 
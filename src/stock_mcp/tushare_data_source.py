@@ -286,6 +286,9 @@ class TushareDataSource(FinancialDataInterface):
     def get_report_dates(self, stock_code: str) -> Optional[List[Dict[Any, Any]]]:
         return None
 
+    def get_fundamental_bundle(self, stock_code: str, include_scope: bool = True) -> Optional[Dict[str, Any]]:
+        return None
+
     def get_business_scope(self, stock_code: str) -> Optional[Dict[Any, Any]]:
         return None
 
@@ -0,0 +1,123 @@
+"""
+基于 SQLite 的持久化响应缓存
+
+历史 K 线、估值分位数等数据在收盘后基本不变，进程重启后仍可复用。
+缓存值以 JSON 文本保存，过期时间使用墙上时钟，以便跨进程共享。
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    SQLite 持久化 TTL 缓存
+
+    读写失败只记录警告并视为未命中，不影响正常请求。
+    打开时及每写入 PURGE_INTERVAL 次清理一次过期条目。
+    """
+
+    PURGE_INTERVAL = 256
+
+    def __init__(self, path: str):
+        """
+        打开（必要时创建）缓存文件，并清理已过期的条目
+
+        Args:
+            path: SQLite 文件路径
+
+        Raises:
+            sqlite3.Error: 文件无法打开或初始化失败
+        """
+        self.path = path
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, expires_at REAL, value TEXT)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)")
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+        self.purge_expired()
+
+    @staticmethod
+    def _digest(key: Hashable) -> str:
+        return hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """获取未过期的缓存值，不存在或已过期返回 default"""
+        item = self.get_item(key)
+        return default if item is None else item[1]
+
+    def get_item(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """
+        获取未过期的缓存条目
+
+        Returns:
+            (剩余有效期（秒）, 缓存值)，不存在或已过期返回 None
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT expires_at, value FROM cache WHERE key = ?", (self._digest(key),)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"读取磁盘缓存失败: {e}")
+            return None
+        if row is None:
+            return None
+        remaining = row[0] - time.time()
+        if remaining <= 0:
+            return None
+        return remaining, json.loads(row[1])
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        写入缓存
+
+        Args:
+            key: 缓存键
+            value: 可 JSON 序列化的缓存值
+            ttl: 有效期（秒）
+        """
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, expires_at, value) VALUES (?, ?, ?)",
+                    (self._digest(key), time.time() + ttl, json.dumps(value, ensure_ascii=False)),
+                )
+                self._writes += 1
+                purge = self._writes % self.PURGE_INTERVAL == 0
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"写入磁盘缓存失败: {e}")
+            return
+        if purge:
+            self.purge_expired()
+
+    def purge_expired(self) -> None:
+        """删除已过期的条目，避免缓存文件无限增长"""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        except sqlite3.Error as e:
+            logger.warning(f"清理磁盘缓存失败: {e}")
+
+    def clear(self) -> None:
+        """清空缓存"""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM cache")
+        except sqlite3.Error as e:
+            logger.warning(f"清空磁盘缓存失败: {e}")
@@ -0,0 +1,74 @@
+"""
+进程内 DNS 解析缓存
+
+爬虫只会访问少数几个东方财富/深交所域名，每次新建连接都调用 socket.getaddrinfo
+重新解析并无必要。这里用带 TTL 的字典缓存包装 getaddrinfo，
+只对 CACHED_DOMAINS 下的主机在有效期内直接返回上次解析结果，
+其余主机（如 tushare、MCP 服务自身的监听地址）仍走原始解析。
+"""
+
+import socket
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 300
+
+# 只缓存这些域名及其子域名的解析结果
+CACHED_DOMAINS = ("eastmoney.com", "szse.cn")
+_CACHED_SUFFIXES = tuple("." + domain for domain in CACHED_DOMAINS)
+
+_original_getaddrinfo = socket.getaddrinfo
+_cache = {}
+_lock = threading.Lock()
+_ttl = DEFAULT_TTL
+
+
+def _is_cached_host(host) -> bool:
+    if not isinstance(host, str):
+        return False
+    host = host.lower().rstrip(".")
+    return host in CACHED_DOMAINS or host.endswith(_CACHED_SUFFIXES)
+
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    if not _is_cached_host(host):
+        return _original_getaddrinfo(host, port, family, type, proto, flags)
+
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+
+    entry = _cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    # 解析失败时直接抛出，不缓存
+    result = _original_getaddrinfo(host, port, family, type, proto, flags)
+    with _lock:
+        # 写入时顺带清理过期条目，缓存大小不超过有效期内实际访问过的主机数
+        for expired in [k for k, (expires_at, _) in _cache.items() if expires_at <= now]:
+            del _cache[expired]
+        _cache[key] = (now + _ttl, result)
+    return result
+
+
+def install(ttl: int = DEFAULT_TTL) -> None:
+    """
+    替换 socket.getaddrinfo 为带缓存的版本（重复调用只会更新 TTL）
+
+    Args:
+        ttl: 缓存有效期（秒）
+    """
+    global _ttl
+    _ttl = ttl
+    if socket.getaddrinfo is not _cached_getaddrinfo:
+        socket.getaddrinfo = _cached_getaddrinfo
+        logger.debug(f"DNS 缓存已启用，TTL={ttl}s")
+
+
+def clear() -> None:
+    """清空 DNS 缓存"""
+    with _lock:
+        _cache.clear()
@@ -0,0 +1,54 @@
+"""
+MCP 工具统一异常处理
+"""
+
+import functools
+import logging
+from typing import Awaitable, Callable
+
+import anyio.to_thread
+
+from stock_mcp.data_source_interface import DataSourceError
+
+logger = logging.getLogger(__name__)
+
+
+def handle_tool_errors(message: str = "执行失败") -> Callable[[Callable[..., str]], Callable[..., Awaitable[str]]]:
+    """
+    MCP 工具异常处理装饰器
+
+    工具函数只需编写成功路径，异常统一转换为 "{message}: {e}" 文本返回给调用方。
+    数据源错误（DataSourceError，如接口返回失败）属于预期内的上游问题，记录警告；
+    其余异常记录错误日志。
+
+    工具函数按同步方式编写（爬虫使用阻塞的 requests），装饰后变为异步函数，
+    函数体放到工作线程中执行。FastMCP 会在事件循环上直接调用同步工具，
+    一次网络请求（含限流等待、重试退避）就会阻塞整个服务；放到线程中后，
+    多个工具调用可以并行，事件循环也能继续处理其他请求。
+
+    用法（放在 @app.tool() 之下，functools.wraps 保留签名与文档供 FastMCP 生成工具描述）：
+
+        @app.tool()
+        @handle_tool_errors("获取K线失败")
+        def get_kline(...) -> str:
+            ...
+
+    Args:
+        message: 失败时返回文本的前缀
+    """
+    def decorator(fn: Callable[..., str]) -> Callable[..., Awaitable[str]]:
+        def call(*args, **kwargs) -> str:
+            try:
+                return fn(*args, **kwargs)
+            except DataSourceError as e:
+                logger.warning(f"{fn.__name__} {message}: {e}")
+                return f"{message}: {e}"
+            except Exception as e:
+                logger.error(f"{fn.__name__} {message}: {e}")
+                return f"{message}: {e}"
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs) -> str:
+            return await anyio.to_thread.run_sync(functools.partial(call, *args, **kwargs))
+        return wrapper
+    return decorator
@@ -5,6 +5,7 @@
 import logging
 import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 
@@ -194,7 +195,6 @@ def format_timestamp(timestamp) -> str:
             timestamp = timestamp / 1000
             
         # 转换为本地时间字符串
-        from datetime import datetime
         dt = datetime.fromtimestamp(timestamp)
         return dt.strftime("%Y-%m-%d %H:%M:%S")
     except (ValueError, OSError, Exception):
@@ -237,12 +237,19 @@ def add_exchange_suffix(stock_code: str) -> str:
     return f"{stock_code}.{exchange}"
 
 
+# A 股代码首位 -> 交易所代码
+# 上海：6xxxx、5xxxx；深圳：0xxxx、3xxxx；北交所：4xxxx、8xxxx
+_A_SHARE_EXCHANGES = {"6": "SH", "5": "SH", "0": "SZ", "3": "SZ", "4": "BJ", "8": "BJ"}
+
+
+@lru_cache(maxsize=4096)
 def _get_exchange_code(stock_code: str) -> str:
     """
     根据股票代码自动识别交易所代码
 
     港股判断必须放在 A 股的前面，
     因为港股也常以 0 开头（如 00700、01810），否则会被误判为 SZ。
+    纯函数，按代码缓存识别结果。
     """
     if not stock_code:
         return "SH"  # 默认上海交易所
@@ -251,23 +258,8 @@ def _get_exchange_code(stock_code: str) -> str:
 
     # ---- 1. 先判断港股 ----
     # 规则：5 位数字 或 结尾 .HK
-    if code.endswith(".HK"):
-        return "HK"
-    if code.isdigit() and len(code) == 5:
+    if code.endswith(".HK") or (len(code) == 5 and code.isdigit()):
         return "HK"
 
-    # ---- 2. 再判断 A 股 ----
-    # 上海：6xxxx、5xxxx
-    if code.startswith(("6", "5")):
-        return "SH"
-
-    # 深圳：0xxxx、3xxxx
-    if code.startswith(("0", "3")):
-        return "SZ"
-
-    # ---- 3. 再判断北交所 ----
-    if code.startswith(("4", "8")):
-        return "BJ"
-
-    # ---- 4. 兜底 ----
-    return "SH"
+    # ---- 2. 再按首位查 A 股 / 北交所，未知默认上海 ----
+    return _A_SHARE_EXCHANGES.get(code[0], "SH")